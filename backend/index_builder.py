@@ -107,13 +107,16 @@ class IndexBuilder:
     # Index is now initialized in __init__ - no lazy initialization needed
     
     
-    def build_index_from_folder(self, folder_path: str = None, file_extensions: List[str] = None) -> Dict[str, Any]:
+    def build_index_from_folder(self, folder_path: str = None, file_extensions: List[str] = None,
+                                metadata_workers: int = 1) -> Dict[str, Any]:
         """
         Build index from all text files in a folder using LlamaIndex
         
         Args:
             folder_path: Path to folder containing text files (uses config default if None)
             file_extensions: List of file extensions to process (uses config default if None)
+            metadata_workers: Processes for content metadata extraction (1 = in-process; >1 or -1
+                only from a standalone script, see DocumentProcessor.enhance_document_metadata)
         
         Returns:
             Dictionary with build statistics
@@ -135,7 +138,7 @@ class IndexBuilder:
             documents = reader.load_data()
 
             if extract_metadata:
-                documents = self.document_processor.enhance_document_metadata(documents)
+                documents = self.document_processor.enhance_document_metadata(documents, n_jobs=metadata_workers)
 
             print(f"Loaded {len(documents)} documents from {folder_path}")
 
@@ -241,30 +241,25 @@ class SimpleRouterApp:
             
             # Filter chunks by similarity threshold
             threshold = state.get("threshold", 0.45)
-            from utils.rag_utils import filter_chunks_by_similarity, get_filtering_metrics
-            filtered_retrieved = filter_chunks_by_similarity(retrieved, threshold)
+            from utils.rag_utils import filter_and_metrics
+            filtered_retrieved, filtering_metrics = filter_and_metrics(retrieved, threshold)
             
             # Update context and scores based on filtered chunks
             filtered_context_parts = []
-            filtered_scores = []
             filtered_valid_chunk_ids = []
             
             for i, chunk in enumerate(filtered_retrieved):
                 cid = f"C{i+1}"
                 filtered_context_parts.append(f"{cid}: {chunk['text']}")
-                filtered_scores.append(chunk['score'])
                 filtered_valid_chunk_ids.append(cid)
             
             context = "\n\n".join(filtered_context_parts)
-            avg_score = sum(filtered_scores) / len(filtered_scores) if filtered_scores else 0.0
+            avg_score = filtering_metrics["avg_filtered_score"]
             
             print(f"[RETRIEVE] Original chunks: {len(retrieved)}, Filtered chunks: {len(filtered_retrieved)}")
             print(f"[RETRIEVE] Average similarity: {avg_score:.3f}")
             print(f"[RETRIEVE] Context length: {len(context)}")
             
-            # Get filtering metrics
-            filtering_metrics = get_filtering_metrics(retrieved, filtered_retrieved, threshold)
-            
             return {
                 "retrieved": filtered_retrieved,  # Return filtered chunks
                 "context": context,
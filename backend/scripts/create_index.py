@@ -42,6 +42,8 @@ def main():
                        help="Source folder for documents")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Verbose output")
+    parser.add_argument("--metadata-workers", type=int, default=1,
+                       help="Processes for document metadata extraction (-1 = all cores)")
     
     args = parser.parse_args()
     
@@ -86,7 +88,7 @@ def main():
         index_builder.clear_index()
     
     print(f"🔨 Building index from {args.source_folder}...")
-    result = index_builder.build_index_from_folder(args.source_folder)
+    result = index_builder.build_index_from_folder(args.source_folder, metadata_workers=args.metadata_workers)
     
     if result:
         print("✅ Index setup completed successfully!")
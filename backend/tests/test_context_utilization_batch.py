@@ -0,0 +1,98 @@
+# Copyright 2025 Emad Noorizadeh
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test script for context_utilization_report_batch (serial vs process pool)
+Author: Emad Noorizadeh
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.metric_utils import context_utilization_report_batch, context_utilization_report_with_entities
+
+# Model-free settings so serial and pooled runs are deterministic and need no downloads
+REPORT_KWARGS = {"use_spacy_ner": False, "use_embed_alignment": False}
+
+QUESTIONS = [
+    "What is the Gold tier bonus?",
+    "How do I contact support?",
+    "When does the offer end?",
+    "What fee applies to wire transfers?",
+]
+ANSWERS = [
+    "Gold tier members get a 25% rewards bonus on credit card purchases.",
+    "Call support at 555-123-4567 or email help@example.com.",
+    "The offer ends on 2024-12-31 for accounts opened before Jan 5, 2024.",
+    "I don't know.",
+]
+CONTEXTS = [
+    ["The Gold tier gives a 25% rewards bonus on eligible credit card purchases.",
+     "Platinum Honors members get a 75% bonus."],
+    ["Contact support at 555-123-4567.", "Email help@example.com for account questions."],
+    ["This offer expires 2024-12-31.", "Accounts must be opened before Jan 5, 2024."],
+    [],
+]
+
+
+def _items(n):
+    return [(QUESTIONS[i % 4], ANSWERS[i % 4], CONTEXTS[i % 4]) for i in range(n)]
+
+
+def test_batch_matches_single_reports():
+    """Serial batch returns exactly the per-row reports, in order"""
+    print("🔧 Test 1: Serial batch vs single reports...")
+    items = _items(8)
+    batch = context_utilization_report_batch(items, n_jobs=1, **REPORT_KWARGS)
+    single = [context_utilization_report_with_entities(q, a, c, **REPORT_KWARGS) for q, a, c in items]
+    assert batch == single
+    print(f"✓ {len(batch)} reports match")
+
+
+def test_batch_pooled_matches_serial():
+    """Process-pool batch returns the same reports as the serial path, in input order"""
+    print("\n🔧 Test 2: Pooled batch vs serial batch...")
+    items = _items(12)
+    serial = context_utilization_report_batch(items, n_jobs=1, **REPORT_KWARGS)
+    # Spawned workers start with empty report caches, so every pooled report is recomputed
+    pooled = context_utilization_report_batch(items, n_jobs=2, **REPORT_KWARGS)
+    assert len(pooled) == len(items)
+    assert pooled == serial
+    print(f"✓ {len(pooled)} pooled reports match the serial run")
+
+
+def test_batch_empty():
+    """Empty input returns an empty list without starting a pool"""
+    print("\n🔧 Test 3: Empty batch...")
+    assert context_utilization_report_batch([], n_jobs=-1, **REPORT_KWARGS) == []
+    print("✓ Empty batch returns []")
+
+
+def test_context_utilization_batch():
+    """Run all context_utilization_report_batch tests"""
+    print("=== Testing context_utilization_report_batch ===\n")
+    try:
+        test_batch_matches_single_reports()
+        test_batch_pooled_matches_serial()
+        test_batch_empty()
+        print("\n🎉 All context_utilization_report_batch tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"\n❌ context_utilization_report_batch test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    test_context_utilization_batch()
@@ -0,0 +1,71 @@
+# Copyright 2025 Emad Noorizadeh
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test script for calculate_context_utilization_percentage (plain, JSON-serializable result)
+Author: Emad Noorizadeh
+"""
+
+import os
+import sys
+import json
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.metric_utils import calculate_context_utilization_percentage, ContextUtilizationResult
+
+CASES = [
+    ("Gold tier members get a 25% rewards bonus on credit card purchases.",
+     ["The Gold tier gives a 25% rewards bonus on eligible credit card purchases.",
+      "Platinum Honors members get a 75% bonus."]),
+    ("The offer ends on 2024-12-31.", ["This offer expires 2024-12-31."]),
+    ("I don't know.", []),
+]
+
+
+def test_result_is_json_serializable_dict():
+    """The result is a real dict that round-trips through json"""
+    print("🔧 Test 1: JSON serialization of the result...")
+    for answer, contexts in CASES:
+        result = calculate_context_utilization_percentage(answer, contexts)
+        assert isinstance(result, dict), type(result)
+        assert json.loads(json.dumps(result)) == result
+    print(f"✓ {len(CASES)} results serialize")
+
+
+def test_typed_view_round_trip():
+    """ContextUtilizationResult(**result) exposes the same fields and as_dict() gives the dict back"""
+    print("\n🔧 Test 2: Typed view round trip...")
+    answer, contexts = CASES[0]
+    result = calculate_context_utilization_percentage(answer, contexts)
+    view = ContextUtilizationResult(**result)
+    assert view.as_dict() == result
+    assert view.precision_token == result["precision_token"]
+    print(f"✓ precision_token={view.precision_token}")
+
+
+def test_context_utilization_percentage():
+    """Run all calculate_context_utilization_percentage tests"""
+    print("=== Testing calculate_context_utilization_percentage ===\n")
+    try:
+        test_result_is_json_serializable_dict()
+        test_typed_view_round_trip()
+        print("\n🎉 All calculate_context_utilization_percentage tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"\n❌ calculate_context_utilization_percentage test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    test_context_utilization_percentage()
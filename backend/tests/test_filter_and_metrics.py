@@ -0,0 +1,81 @@
+# Copyright 2025 Emad Noorizadeh
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test script for filter_and_metrics (single-pass chunk filtering + metrics)
+Author: Emad Noorizadeh
+"""
+
+import os
+import sys
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rag_utils import filter_and_metrics, filter_chunks_by_similarity, get_filtering_metrics
+
+
+def _two_pass(chunks, threshold):
+    filtered = filter_chunks_by_similarity(chunks, threshold)
+    return filtered, get_filtering_metrics(chunks, filtered, threshold)
+
+
+def test_filter_and_metrics_empty():
+    """Empty input gives no chunks and zeroed score metrics"""
+    print("🔧 Test 1: Empty input...")
+    kept, metrics = filter_and_metrics([], 0.5)
+    expected_kept, expected_metrics = _two_pass([], 0.5)
+    assert kept == expected_kept == []
+    assert metrics == expected_metrics
+    print(f"✓ Metrics: {metrics}")
+
+
+def test_filter_and_metrics_matches_two_pass():
+    """filter_and_metrics agrees with filter_chunks_by_similarity + get_filtering_metrics"""
+    print("\n🔧 Test 2: Compare against the two-pass functions...")
+    rng = random.Random(0)
+    cases = [
+        ([{"id": "c1", "score": 0.9}, {"id": "c2", "score": 0.2}, {"id": "c3", "score": 0.5}], 0.5),
+        ([{"id": "c1", "score": 0.1}, {"id": "c2", "score": 0.2}], 0.5),  # everything filtered out
+        ([{"id": "c1"}, {"id": "c2", "score": 0.7}], 0.0),                 # missing score counts as 0.0
+        ([{"id": "c1", "score": -0.3}, {"id": "c2", "score": 0.4}], -1.0),
+    ]
+    for _ in range(200):
+        chunks = [{"id": f"c{i}", "score": round(rng.uniform(-1, 1), 3)} for i in range(rng.randint(0, 12))]
+        cases.append((chunks, round(rng.uniform(-1, 1), 2)))
+
+    for chunks, threshold in cases:
+        kept, metrics = filter_and_metrics(chunks, threshold)
+        expected_kept, expected_metrics = _two_pass(chunks, threshold)
+        assert kept == expected_kept, (chunks, threshold)
+        assert metrics.keys() == expected_metrics.keys()
+        for key, value in expected_metrics.items():
+            assert abs(metrics[key] - value) < 1e-12, (key, metrics[key], value)
+    print(f"✓ {len(cases)} cases match")
+
+
+def test_filter_and_metrics_suite():
+    """Run all filter_and_metrics tests"""
+    print("=== Testing filter_and_metrics ===\n")
+    try:
+        test_filter_and_metrics_empty()
+        test_filter_and_metrics_matches_two_pass()
+        print("\n🎉 All filter_and_metrics tests passed!")
+        return True
+    except AssertionError as e:
+        print(f"\n❌ filter_and_metrics test failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    test_filter_and_metrics_suite()
@@ -19,6 +19,7 @@ Author: Emad Noorizadeh
 
 from .metric_utils import (
     calculate_context_utilization_percentage,
+    ContextUtilizationResult,
     calculate_confidence_score,
     calculate_faithfulness_score,
     calculate_completeness_score
@@ -65,6 +66,7 @@ from .rag_utils import (
 __all__ = [
     # Metric utilities
     "calculate_context_utilization_percentage",
+    "ContextUtilizationResult",
     "calculate_confidence_score",
     "calculate_faithfulness_score",
     "calculate_completeness_score",
@@ -26,13 +26,35 @@ Key Features:
 - Completeness assessment to evaluate how fully questions are answered
 - Robust edge case handling for null/empty inputs and clarification scenarios
 
+Regex convention: hot patterns are compiled once as module-level _RE_* constants; any
+other pattern is obtained through _re(pattern, flags), an LRU cache of compiled objects,
+rather than via re.sub/re.fullmatch/re.compile with a raw string at the call site.
+
 Author: Emad Noorizadeh
 """
 
+import inspect
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Any, Tuple, Optional
-from collections import Counter, defaultdict
+import time
+from typing import List, Dict, Any, Tuple, Optional, FrozenSet, Union, AbstractSet, Iterator
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from hashlib import blake2b
+from bisect import bisect_left
+from itertools import islice
 from math import log, sqrt
+from threading import Lock
+
+try:
+    import numpy as np
+except ImportError:  # optional: unsupported-term ranking falls back to a Python sort
+    np = None
 
 # Minimal, deterministic utilities
 
@@ -46,7 +68,17 @@ _STOPWORDS = {
 }
 
 _WORD_RE = re.compile(r"\b[\w$%.-]+\b", re.UNICODE)
+# Plain word tokens for the simple overlap heuristics (faithfulness)
+_PLAIN_WORD_RE = re.compile(r"\b\w+\b")
+# Whitespace-delimited runs; counts the same words as len(text.split()) without building the list
+_RE_NONSPACE = re.compile(r"\S+")
+
+@lru_cache(maxsize=256)
+def _re(pattern: str, flags: int = 0) -> "re.Pattern":
+    """Compiled regex for (pattern, flags), cached so helpers never recompile per call."""
+    return re.compile(pattern, flags)
 
+@lru_cache(maxsize=16384)
 def _simple_lemma(tok: str) -> str:
     """Cheap, deterministic normalizer w/out external deps."""
     t = tok.lower()
@@ -54,16 +86,16 @@ def _simple_lemma(tok: str) -> str:
     t = t.strip(".,;:!?()[]{}'\"")
     # normalize money like $20,000.00 -> $20000
     if t.startswith("$"):
-        digits = re.sub(r"[^\d]", "", t[1:])
+        digits = _re(r"[^\d]").sub("", t[1:])
         return f"${digits}" if digits else "$"
     # normalize percents like 12.5% -> 12.5%
     if t.endswith("%"):
         core = t[:-1]
-        core = re.sub(r"[^\d.]", "", core)
+        core = _re(r"[^\d.]").sub("", core)
         return f"{core}%" if core else "%"
     # normalize plain numbers 1,234.00 -> 1234
-    if re.fullmatch(r"[-+]?\d[\d,]*\.?\d*", t):
-        return re.sub(r"[,\s]", "", t)
+    if _re(r"[-+]?\d[\d,]*\.?\d*").fullmatch(t):
+        return _re(r"[,\s]").sub("", t)
     # crude plural/verb endings
     for suf in ("'s","'s","s","es","ed","ing"):
         if t.endswith(suf) and len(t) > len(suf) + 2:
@@ -72,7 +104,12 @@ def _simple_lemma(tok: str) -> str:
     return t
 
 def _tokens(text: str):
-    return [_simple_lemma(t) for t in _WORD_RE.findall(text or "")]
+    return list(_token_tuple(text or ""))
+
+@lru_cache(maxsize=4096)
+def _token_tuple(text: str) -> Tuple[str, ...]:
+    """Tokenize each distinct string once; a report re-tokenizes the same answer and sentences."""
+    return tuple(_simple_lemma(t) for t in _WORD_RE.findall(text))
 
 def _token_spans(text: str):
     """Return (token_text, start, end) using the same regex used for tokenization."""
@@ -92,6 +129,15 @@ def _normalized_token_spans(text: str):
 def _informative_terms(tokens):
     return [t for t in tokens if t and t not in _STOPWORDS and not t.isdigit() and t not in {"$", "%"}]
 
+@lru_cache(maxsize=4096)
+def _text_terms(text: str) -> Tuple[str, ...]:
+    """Informative terms of a string, memoized like its tokens."""
+    return tuple(_informative_terms(_token_tuple(text)))
+
+def _as_term_set(terms: Union[List[str], AbstractSet[str]]) -> AbstractSet[str]:
+    """Reuse an already-hashed term set; only lists pay for set construction."""
+    return terms if isinstance(terms, (set, frozenset)) else frozenset(terms)
+
 def _build_idf(snippets_tokens):
     """IDF from snippets; small, deterministic."""
     df = Counter()
@@ -113,9 +159,13 @@ def _weighted_recall(numer: Counter, denom: Counter, idf):
     w_denom = sum(idf.get(t, 1.0) * c for t, c in denom.items())
     return (w_inter / w_denom) if w_denom > 0 else 0.0
 
-def _weighted_precision(answer_terms: list[str], context_terms: list[str], idf):
-    a = Counter(answer_terms)
-    c = Counter(context_terms)
+def _as_counter(terms: Union[List[str], Counter]) -> Counter:
+    """Reuse a prebuilt Counter; only raw term lists pay for counting."""
+    return terms if isinstance(terms, Counter) else Counter(terms)
+
+def _weighted_precision(answer_terms: Union[List[str], Counter], context_terms: Union[List[str], Counter], idf):
+    a = _as_counter(answer_terms)
+    c = _as_counter(context_terms)
     # precision: overlap against answer mass
     w_inter = 0.0
     w_answer = sum(idf.get(t, 1.0) * cnt for t, cnt in a.items())
@@ -134,11 +184,11 @@ def _extract_numbers_and_units(text: str):
     toks = _tokens(text)
     numbers = []
     for t in toks:
-        if t.startswith("$") and re.fullmatch(r"\$\d+", t):
+        if t.startswith("$") and _re(r"\$\d+").fullmatch(t):
             numbers.append(("money", t))
-        elif t.endswith("%") and re.fullmatch(r"\d+(\.\d+)?%", t):
+        elif t.endswith("%") and _re(r"\d+(\.\d+)?%").fullmatch(t):
             numbers.append(("percent", t))
-        elif re.fullmatch(r"[-+]?\d+(\.\d+)?", t):
+        elif _re(r"[-+]?\d+(\.\d+)?").fullmatch(t):
             numbers.append(("number", t))
     return set(numbers)
 
@@ -155,31 +205,9 @@ def _numeric_match_only(answer: str, contexts: List[str]) -> float:
 
 def _split_sentences(text: str):
     # Deterministic, simple splitter
-    parts = re.split(r"(?<=[.!?])\s+(?=[A-Z0-9$])", text.strip() or "")
+    parts = _re(r"(?<=[.!?])\s+(?=[A-Z0-9$])").split(text.strip() or "")
     return [p for p in parts if p]
 
-def _collect_supported_terms(answer: str, ctx_terms_all: List[str], idf: Dict[str, float]):
-    """Collect supported terms with character spans for UI highlighting."""
-    ctx_set = set(ctx_terms_all)
-    # global list (counts over the whole answer)
-    counts = Counter()
-    spans_per_sentence = []
-    # sentence-level spans for UI
-    for sent in _split_sentences(answer):
-        per_sent = []
-        offset = answer.find(sent)  # deterministic; safe because we split by exact substring
-        for norm, s, e, surface in _normalized_token_spans(sent):
-            if norm in ctx_set:
-                counts[norm] += 1
-                per_sent.append({"term": norm, "start": offset + s, "end": offset + e})
-        spans_per_sentence.append({"sentence": sent, "supported_terms": per_sent})
-
-    supported_global = [
-        {"term": t, "count": c, "idf": round(idf.get(t, 1.0), 4)}
-        for t, c in sorted(counts.items(), key=lambda kv: (-kv[1]*idf.get(kv[0],1.0), kv[0]))
-    ]
-    return supported_global, spans_per_sentence
-
 # =========================
 # BM25 (optional) for best-context selection
 # =========================
@@ -195,9 +223,9 @@ def _bm25_score(query_ctr: Counter, doc_ctr: Counter, idf: Dict[str, float], avg
         score += idf.get(term, 1.0) * tf * (k1 + 1) / (denom if denom > 0 else 1.0)
     return score
 
-def _pick_best_context_by_bm25(ans_terms: List[str], contexts_terms: List[List[str]], idf: Dict[str, float]) -> int:
+def _pick_best_context_by_bm25(ans_terms: Union[List[str], Counter], contexts_terms: List[List[str]], idf: Dict[str, float]) -> int:
     doc_ctrs = [Counter(t) for t in contexts_terms]
-    ans_ctr = Counter(ans_terms)
+    ans_ctr = _as_counter(ans_terms)
     lengths = [sum(c.values()) for c in doc_ctrs]
     avgdl = sum(lengths) / max(1, len(lengths))
     best_i, best_s = 0, float("-inf")
@@ -225,28 +253,41 @@ _RE_QUOTED = re.compile(r"['\"]([^'\"]{2,})['\"]")
 _RE_MONEY = re.compile(r"\$[\d,]+(?:\.\d{2})?")
 _RE_PERCENT = re.compile(r"\d+(?:\.\d+)?%")
 
+# (pattern, entity type, capture group) in extraction order
+_ENTITY_PATTERNS = [
+    (_RE_EMAIL, "email", 0), (_RE_URL, "url", 0), (_RE_PHONE, "phone", 0),
+    (_RE_DATE_ISO, "date", 0), (_RE_DATE_SLASH, "date", 0), (_RE_DATE_TEXT, "date", 0),
+    (_RE_TIME, "time", 0), (_RE_ACRONYM, "acronym", 0), (_RE_IDLIKE, "id", 0),
+    (_RE_QUOTED, "quoted", 1), (_RE_MONEY, "money", 0), (_RE_PERCENT, "percent", 0),
+]
+# Byte-pattern twins for ASCII-only text, where byte offsets equal character offsets
+# (\x1c-\x1f are whitespace to Unicode \s but not to bytes \s, so text containing them stays on str)
+_RE_UNICODE_ONLY_SPACE = re.compile(r"[\x1c-\x1f]")
+_ENTITY_PATTERNS_BYTES = [
+    (re.compile(rx.pattern.encode("ascii"), rx.flags & ~re.UNICODE), et, g) for rx, et, g in _ENTITY_PATTERNS
+]
+
+def _collect_entity_matches(t: str) -> List[Tuple[int, int, str, str]]:
+    """Run every entity pattern over t, returning (start, end, type, text) matches."""
+    if t.isascii() and not _RE_UNICODE_ONLY_SPACE.search(t):
+        tb = t.encode("ascii")
+        return [(m.start(g), m.end(g), et, m.group(g).decode("ascii"))
+                for rx, et, g in _ENTITY_PATTERNS_BYTES for m in rx.finditer(tb)]
+    return [(m.start(g), m.end(g), et, m.group(g))
+            for rx, et, g in _ENTITY_PATTERNS for m in rx.finditer(t)]
+
 def _norm_ent(s: str) -> str:
     return s.strip().lower()
 
 def _extract_entities_regex(text: str) -> List[Tuple[str, str]]:
     """Extract only specific, well-defined entities using regex."""
-    t = text or ""
-    ents: List[Tuple[str, str]] = []
-    
+    return [(et, _norm_ent(tx)) for et, tx, _, _ in _entity_spans_cached(text or "")]
+
+@lru_cache(maxsize=1024)
+def _entity_spans_cached(t: str) -> Tuple[Tuple[str, str, int, int], ...]:
+    """Single regex pass per distinct text; immutable so cached results can be shared."""
     # Collect all matches with their positions to avoid overlaps
-    matches = []
-    for m in _RE_EMAIL.finditer(t): matches.append((m.start(), m.end(), "email", m.group(0)))
-    for m in _RE_URL.finditer(t): matches.append((m.start(), m.end(), "url", m.group(0)))
-    for m in _RE_PHONE.finditer(t): matches.append((m.start(), m.end(), "phone", m.group(0)))
-    for m in _RE_DATE_ISO.finditer(t): matches.append((m.start(), m.end(), "date", m.group(0)))
-    for m in _RE_DATE_SLASH.finditer(t): matches.append((m.start(), m.end(), "date", m.group(0)))
-    for m in _RE_DATE_TEXT.finditer(t): matches.append((m.start(), m.end(), "date", m.group(0)))
-    for m in _RE_TIME.finditer(t): matches.append((m.start(), m.end(), "time", m.group(0)))
-    for m in _RE_ACRONYM.finditer(t): matches.append((m.start(), m.end(), "acronym", m.group(0)))
-    for m in _RE_IDLIKE.finditer(t): matches.append((m.start(), m.end(), "id", m.group(0)))
-    for m in _RE_QUOTED.finditer(t): matches.append((m.start(1), m.end(1), "quoted", m.group(1)))
-    for m in _RE_MONEY.finditer(t): matches.append((m.start(), m.end(), "money", m.group(0)))
-    for m in _RE_PERCENT.finditer(t): matches.append((m.start(), m.end(), "percent", m.group(0)))
+    matches = _collect_entity_matches(t)
     
     # Sort by start position, then by length (longer first)
     matches.sort(key=lambda x: (x[0], -(x[1] - x[0])))
@@ -265,58 +306,24 @@ def _extract_entities_regex(text: str) -> List[Tuple[str, str]]:
             filtered_matches.append((start, end, entity_type, entity_text))
     
     # Convert to final format
-    for start, end, entity_type, entity_text in filtered_matches:
-        ents.append((entity_type, _norm_ent(entity_text)))
-    
-    return ents
+    return tuple((entity_type, entity_text, start, end) for start, end, entity_type, entity_text in filtered_matches)
 
 def _extract_entities_regex_with_spans(text: str) -> List[Tuple[str, str, int, int]]:
     """Extract entities with character spans for UI highlighting."""
-    t = text or ""
-    
-    # Collect all matches with their positions to avoid overlaps
-    matches = []
-    for m in _RE_EMAIL.finditer(t): matches.append((m.start(), m.end(), "email", m.group(0)))
-    for m in _RE_URL.finditer(t): matches.append((m.start(), m.end(), "url", m.group(0)))
-    for m in _RE_PHONE.finditer(t): matches.append((m.start(), m.end(), "phone", m.group(0)))
-    for m in _RE_DATE_ISO.finditer(t): matches.append((m.start(), m.end(), "date", m.group(0)))
-    for m in _RE_DATE_SLASH.finditer(t): matches.append((m.start(), m.end(), "date", m.group(0)))
-    for m in _RE_DATE_TEXT.finditer(t): matches.append((m.start(), m.end(), "date", m.group(0)))
-    for m in _RE_TIME.finditer(t): matches.append((m.start(), m.end(), "time", m.group(0)))
-    for m in _RE_ACRONYM.finditer(t): matches.append((m.start(), m.end(), "acronym", m.group(0)))
-    for m in _RE_IDLIKE.finditer(t): matches.append((m.start(), m.end(), "id", m.group(0)))
-    for m in _RE_QUOTED.finditer(t): matches.append((m.start(1), m.end(1), "quoted", m.group(1)))
-    for m in _RE_MONEY.finditer(t): matches.append((m.start(), m.end(), "money", m.group(0)))
-    for m in _RE_PERCENT.finditer(t): matches.append((m.start(), m.end(), "percent", m.group(0)))
-    
-    # Sort by start position, then by length (longer first)
-    matches.sort(key=lambda x: (x[0], -(x[1] - x[0])))
-    
-    # Remove overlapping matches, keeping longer ones
-    filtered_matches = []
-    for start, end, entity_type, entity_text in matches:
-        # Check if this match overlaps with any already added match
-        overlaps = False
-        for existing_start, existing_end, _, _ in filtered_matches:
-            if not (end <= existing_start or start >= existing_end):
-                overlaps = True
-                break
-        
-        if not overlaps:
-            filtered_matches.append((start, end, entity_type, entity_text))
-    
-    # Convert to final format
-    out = []
-    for start, end, entity_type, entity_text in filtered_matches:
-        out.append((entity_type, entity_text, start, end))
-    
-    return out
+    return list(_entity_spans_cached(text or ""))
 
 # =========================
 # Optional spaCy NER (merged with regex)
 # =========================
 
-_SPACY_NLP = None
+_SPACY_CACHE: Dict[str, Any] = {}  # model name -> loaded pipeline
+_SPACY_FAILED_AT: Dict[str, float] = {}  # model name -> monotonic time of the last failed load
+_LOAD_RETRY_SECONDS = 60.0  # a failed model load is retried after this long rather than per call
+_SPACY_DISABLE = ["tagger", "parser", "lemmatizer", "attribute_ruler", "textcat"]
+_SPACY_BATCH_SIZE = 32
+_SPACY_ENTS_MAXSIZE = 1024
+_SPACY_ENTS: "OrderedDict[Tuple[str, str], Tuple[Tuple[str, str, int, int], ...]]" = OrderedDict()
+_SPACY_ENTS_LOCK = Lock()
 _SPACY_LABEL_MAP = {
     "PERSON": "proper", "ORG": "proper", "GPE": "proper", "LOC": "proper",
     "PRODUCT": "proper", "FAC": "proper", "WORK_OF_ART": "proper", "EVENT": "proper",
@@ -325,40 +332,69 @@ _SPACY_LABEL_MAP = {
 }
 
 def _maybe_load_spacy(model_name: str = "en_core_web_sm"):
-    global _SPACY_NLP
-    if _SPACY_NLP is not None:
-        return _SPACY_NLP
+    """Load a spaCy pipeline once per model name, keeping only tok2vec + ner."""
+    nlp = _SPACY_CACHE.get(model_name)
+    if nlp is not None:
+        return nlp
+    failed_at = _SPACY_FAILED_AT.get(model_name)
+    if failed_at is not None and time.monotonic() - failed_at < _LOAD_RETRY_SECONDS:
+        return None
     try:
         import spacy
-        _SPACY_NLP = spacy.load(model_name, disable=["tagger","parser","lemmatizer","textcat"])
+        nlp = spacy.load(model_name, disable=_SPACY_DISABLE)
     except Exception:
-        _SPACY_NLP = None
-    return _SPACY_NLP
+        _SPACY_FAILED_AT[model_name] = time.monotonic()
+        return None
+    _SPACY_FAILED_AT.pop(model_name, None)
+    _SPACY_CACHE[model_name] = nlp
+    return nlp
 
-def _extract_entities_spacy(text: str, model_name: str = "en_core_web_sm") -> List[Tuple[str, str]]:
-    nlp = _maybe_load_spacy(model_name)
-    if nlp is None or not text:
-        return []
-    doc = nlp(text)
-    ents: List[Tuple[str, str]] = []
+def _spacy_doc_entities(doc) -> Tuple[Tuple[str, str, int, int], ...]:
+    out = []
     for ent in doc.ents:
         mapped = _SPACY_LABEL_MAP.get(ent.label_)
         if mapped:
-            ents.append((mapped, ent.text.strip().lower()))
-    return ents
+            out.append((mapped, ent.text, ent.start_char, ent.end_char))
+    return tuple(out)
+
+def _spacy_entities_batch(texts: List[str], model_name: str) -> List[Tuple[Tuple[str, str, int, int], ...]]:
+    """NER for several texts, running the uncached ones through a single nlp.pipe pass.
+
+    Results are memoized per (model, text) so _entity_match and _entity_alignment share one pass.
+    """
+    nlp = _maybe_load_spacy(model_name)
+    if nlp is None:
+        return [() for _ in texts]
+
+    found: Dict[str, Tuple[Tuple[str, str, int, int], ...]] = {"": ()}
+    with _SPACY_ENTS_LOCK:
+        for t in texts:
+            if t not in found:
+                hit = _SPACY_ENTS.get((model_name, t))
+                if hit is not None:
+                    _SPACY_ENTS.move_to_end((model_name, t))
+                    found[t] = hit
+    missing = list(dict.fromkeys(t for t in texts if t not in found))
+
+    if missing:
+        # nlp.pipe is lazy: run NER to completion before taking the lock so requests don't serialize on it
+        missing_ents = [_spacy_doc_entities(doc)
+                        for doc in nlp.pipe(missing, batch_size=_SPACY_BATCH_SIZE, n_process=1)]
+        with _SPACY_ENTS_LOCK:
+            for t, ents in zip(missing, missing_ents):
+                found[t] = ents
+                _SPACY_ENTS[(model_name, t)] = ents
+            while len(_SPACY_ENTS) > _SPACY_ENTS_MAXSIZE:
+                _SPACY_ENTS.popitem(last=False)
+
+    return [found[t] for t in texts]
+
+def _extract_entities_spacy(text: str, model_name: str = "en_core_web_sm") -> List[Tuple[str, str]]:
+    return [(et, txt.strip().lower()) for et, txt, _, _ in _spacy_entities_batch([text or ""], model_name)[0]]
 
 def _extract_entities_spacy_with_spans(text: str, model_name: str = "en_core_web_sm") -> List[Tuple[str, str, int, int]]:
     """Extract entities with character spans using spaCy NER."""
-    nlp = _maybe_load_spacy(model_name)
-    if nlp is None or not text:
-        return []
-    doc = nlp(text)
-    out = []
-    for ent in doc.ents:
-        mapped = _SPACY_LABEL_MAP.get(ent.label_)
-        if mapped:
-            out.append((mapped, ent.text, ent.start_char, ent.end_char))
-    return out
+    return list(_spacy_entities_batch([text or ""], model_name)[0])
 
 def _levenshtein_distance(s1: str, s2: str) -> int:
     """Calculate Levenshtein distance between two strings."""
@@ -380,7 +416,27 @@ def _levenshtein_distance(s1: str, s2: str) -> int:
     
     return previous_row[-1]
 
-def _fuzzy_match_entities(answer_entity, context_entities, threshold: float = 0.8) -> bool:
+def _strip_articles(s: str) -> str:
+    return s.lower().replace("the ", "").replace("a ", "").replace("an ", "").strip()
+
+def _word_mask(words) -> int:
+    """64-bit Bloom-style signature of a word set: sets sharing a word always share a bit."""
+    mask = 0
+    for w in words:
+        mask |= 1 << (hash(w) & 63)
+    return mask
+
+def _prepare_fuzzy_context(context_entities) -> List[Tuple[str, str, FrozenSet[str], int]]:
+    """Precompute (type, article-stripped text, words, word mask) for context entities once per match call."""
+    prepared = []
+    for ctx_et, ctx_ev in context_entities:
+        ctx_ev_clean = _strip_articles(ctx_ev)
+        ctx_ev_words = frozenset(ctx_ev_clean.split())
+        prepared.append((ctx_et, ctx_ev_clean, ctx_ev_words, _word_mask(ctx_ev_words)))
+    return prepared
+
+def _fuzzy_match_entities(answer_entity, context_entities, threshold: float = 0.8,
+                          prepared_context: Optional[List[Tuple[str, str, FrozenSet[str], int]]] = None) -> bool:
     """Check if answer entity has a fuzzy match in context entities using edit distance."""
     et, ev = answer_entity
     
@@ -389,33 +445,34 @@ def _fuzzy_match_entities(answer_entity, context_entities, threshold: float = 0.
         return True
     
     # For all entity types, try fuzzy matching
-    ev_lower = ev.lower()
-    ev_clean = ev_lower.replace("the ", "").replace("a ", "").replace("an ", "").strip()
+    ev_clean = _strip_articles(ev)
+    ev_words = frozenset(ev_clean.split())
+    ev_mask = _word_mask(ev_words)
+    if prepared_context is None:
+        prepared_context = _prepare_fuzzy_context(context_entities)
     
-    for ctx_et, ctx_ev in context_entities:
+    for ctx_et, ctx_ev_clean, ctx_ev_words, ctx_ev_mask in prepared_context:
         if ctx_et == et:  # Same entity type
-            ctx_ev_lower = ctx_ev.lower()
-            ctx_ev_clean = ctx_ev_lower.replace("the ", "").replace("a ", "").replace("an ", "").strip()
-            
             # Calculate similarity based on edit distance
             max_len = max(len(ev_clean), len(ctx_ev_clean))
             if max_len == 0:
                 continue
                 
-            distance = _levenshtein_distance(ev_clean, ctx_ev_clean)
-            similarity = 1.0 - (distance / max_len)
-            
-            if similarity >= threshold:
-                return True
+            # Edit distance is at least the length difference, so skip the DP when even that
+            # lower bound keeps the similarity under threshold
+            if 1.0 - (abs(len(ev_clean) - len(ctx_ev_clean)) / max_len) >= threshold:
+                distance = _levenshtein_distance(ev_clean, ctx_ev_clean)
+                similarity = 1.0 - (distance / max_len)
+                
+                if similarity >= threshold:
+                    return True
             
             # Also check substring matches
             if ev_clean in ctx_ev_clean or ctx_ev_clean in ev_clean:
                 return True
             
-            # Check word overlap for multi-word entities
-            ev_words = set(ev_clean.split())
-            ctx_ev_words = set(ctx_ev_clean.split())
-            if len(ev_words) > 1 and len(ctx_ev_words) > 1:
+            # Check word overlap for multi-word entities; disjoint masks mean no shared word
+            if len(ev_words) > 1 and len(ctx_ev_words) > 1 and ev_mask & ctx_ev_mask:
                 common_words = ev_words.intersection(ctx_ev_words)
                 word_overlap = len(common_words) / min(len(ev_words), len(ctx_ev_words))
                 if word_overlap >= 0.6:  # 60% word overlap
@@ -423,21 +480,28 @@ def _fuzzy_match_entities(answer_entity, context_entities, threshold: float = 0.
     
     return False
 
-def _entity_match(answer: str, contexts: List[str],
-                  use_spacy_ner: bool = True,  # Default to True for better NER
-                  spacy_model: str = "en_core_web_sm") -> Dict[str, Any]:
-    """Entity coverage metrics: regex + spaCy NER with fuzzy matching."""
-    # Start with regex entities (specific patterns)
-    a_ents = set(_extract_entities_regex(answer))
+def _prepare_context_entities(contexts: List[str],
+                              use_spacy_ner: bool = True,
+                              spacy_model: str = "en_core_web_sm") -> FrozenSet[Tuple[str, str]]:
+    """Extract the (type, normalized text) entity set for a batch of contexts once."""
     c_ents = set()
     for s in contexts:
         c_ents |= set(_extract_entities_regex(s or ""))
+    if use_spacy_ner:
+        for ents in _spacy_entities_batch([s or "" for s in contexts], spacy_model):
+            c_ents.update((et, txt.strip().lower()) for et, txt, _, _ in ents)
+    return frozenset(c_ents)
+
+def _entity_match_with_prepared(answer: str, ctx_ents: FrozenSet[Tuple[str, str]],
+                                use_spacy_ner: bool = True,
+                                spacy_model: str = "en_core_web_sm") -> Dict[str, Any]:
+    """Entity coverage metrics against a precomputed context entity set (see _prepare_context_entities)."""
+    # Start with regex entities (specific patterns)
+    a_ents = set(_extract_entities_regex(answer))
 
     # Add spaCy NER entities (better for proper nouns and general entities)
     if use_spacy_ner:
         a_ents |= set(_extract_entities_spacy(answer, spacy_model))
-        for s in contexts:
-            c_ents |= set(_extract_entities_spacy(s or "", spacy_model))
 
     if not a_ents:
         return {"overall": 1.0, "by_type": {}, "unsupported": []}
@@ -445,10 +509,11 @@ def _entity_match(answer: str, contexts: List[str],
     total_by_type: Dict[str,int] = {}
     covered_by_type: Dict[str,int] = {}
     unsupported: List[str] = []
+    prepared_ctx = _prepare_fuzzy_context(ctx_ents)
 
     for et, ev in a_ents:
         total_by_type[et] = total_by_type.get(et, 0) + 1
-        if _fuzzy_match_entities((et, ev), c_ents):
+        if _fuzzy_match_entities((et, ev), ctx_ents, prepared_context=prepared_ctx):
             covered_by_type[et] = covered_by_type.get(et, 0) + 1
         else:
             unsupported.append(f"{et}:{ev}")
@@ -460,10 +525,17 @@ def _entity_match(answer: str, contexts: List[str],
 
     return {"overall": overall, "by_type": by_type, "unsupported": unsupported}
 
-def _entity_alignment(answer: str, contexts: List[str],
-                      use_spacy_ner: bool = True,  # Default to True for better NER
-                      spacy_model: str = "en_core_web_sm") -> Dict[str, Any]:
-    """Entity alignment with supported entities and spans for UI highlighting."""
+def _entity_match(answer: str, contexts: List[str],
+                  use_spacy_ner: bool = True,  # Default to True for better NER
+                  spacy_model: str = "en_core_web_sm") -> Dict[str, Any]:
+    """Entity coverage metrics: regex + spaCy NER with fuzzy matching."""
+    ctx_ents = _prepare_context_entities(contexts, use_spacy_ner, spacy_model)
+    return _entity_match_with_prepared(answer, ctx_ents, use_spacy_ner, spacy_model)
+
+def _entity_alignment_with_prepared(answer: str, ctx_norm_set: FrozenSet[Tuple[str, str]],
+                                    use_spacy_ner: bool = True,
+                                    spacy_model: str = "en_core_web_sm") -> Dict[str, Any]:
+    """Entity alignment against a precomputed context entity set (see _prepare_context_entities)."""
     # collect answer entities with spans
     ans_items = _extract_entities_regex_with_spans(answer)
     if use_spacy_ner:
@@ -478,15 +550,6 @@ def _entity_alignment(answer: str, contexts: List[str],
             seen.add(key)
             a_ents.append((et, txt, s, e))
 
-    # context entity set (normalized by type+text only)
-    ctx_norm_set = set()
-    for s in contexts:
-        ctx_items = _extract_entities_regex_with_spans(s or "")
-        if use_spacy_ner:
-            ctx_items += _extract_entities_spacy_with_spans(s or "", spacy_model)
-        for et, txt, _, _ in ctx_items:
-            ctx_norm_set.add((et, txt.strip().lower()))
-
     if not a_ents:
         return {
             "match": {"overall": 1.0, "by_type": {}, "unsupported": []},
@@ -496,6 +559,7 @@ def _entity_alignment(answer: str, contexts: List[str],
     total_by_type, covered_by_type = Counter(), Counter()
     unsupported = []
     supported_items = []  # with spans for UI
+    prepared_ctx = _prepare_fuzzy_context(ctx_norm_set)
 
     for et, txt, s, e in a_ents:
         total_by_type[et] += 1
@@ -507,7 +571,7 @@ def _entity_alignment(answer: str, contexts: List[str],
             supported_items.append({"type": et, "text": txt, "start": s, "end": e})
         else:
             # Try fuzzy matching
-            if _fuzzy_match_entities(norm, ctx_norm_set):
+            if _fuzzy_match_entities(norm, ctx_norm_set, prepared_context=prepared_ctx):
                 covered_by_type[et] += 1
                 supported_items.append({"type": et, "text": txt, "start": s, "end": e})
             else:
@@ -529,54 +593,132 @@ def _entity_alignment(answer: str, contexts: List[str],
         }
     }
 
+def _entity_alignment(answer: str, contexts: List[str],
+                      use_spacy_ner: bool = True,  # Default to True for better NER
+                      spacy_model: str = "en_core_web_sm") -> Dict[str, Any]:
+    """Entity alignment with supported entities and spans for UI highlighting."""
+    ctx_ents = _prepare_context_entities(contexts, use_spacy_ner, spacy_model)
+    return _entity_alignment_with_prepared(answer, ctx_ents, use_spacy_ner, spacy_model)
+
 # =========================
 # TF-IDF cosine (baseline) and optional embedding alignment
 # =========================
 
-def _tfidf_vector(terms: List[str], idf: Dict[str, float]) -> Dict[str, float]:
-    tf = Counter(terms)
+def _tfidf_vector(terms: Union[List[str], Counter], idf: Dict[str, float]) -> Dict[str, float]:
+    tf = _as_counter(terms)
     return {t: tf[t] * idf.get(t, 1.0) for t in tf}
 
 def _cosine(vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
     if not vec1 or not vec2: return 0.0
-    dot = sum(v * vec2.get(k, 0.0) for k, v in vec1.items())
+    # walk the smaller vector's keys only; the larger one is just probed
+    small, large = (vec1, vec2) if len(vec1) <= len(vec2) else (vec2, vec1)
+    large_get = large.get
+    dot = 0.0
+    for k, v in small.items():
+        lv = large_get(k)
+        if lv is not None:
+            dot += v * lv
+    if dot == 0: return 0.0
     n1 = sqrt(sum(v * v for v in vec1.values()))
     n2 = sqrt(sum(v * v for v in vec2.values()))
     if n1 == 0 or n2 == 0: return 0.0
     return dot / (n1 * n2)
 
-_EMB = None
+def _tfidf_cosine(terms1: List[str], terms2: List[str], idf: Dict[str, float]) -> float:
+    """TF-IDF cosine of two term lists."""
+    return _cosine(_tfidf_vector(terms1, idf), _tfidf_vector(terms2, idf))
+
+@lru_cache(maxsize=1024)
+def _cached_idf(snippets_terms: Tuple[Tuple[str, ...], ...]) -> Dict[str, float]:
+    """_build_idf cached per distinct (contexts, question, answer) term tuples.
+
+    The table is shared between cache hits and must be treated as read-only.
+    """
+    return _build_idf(snippets_terms)
+
+_EMB_CACHE: Dict[str, Any] = {}  # model name -> loaded SentenceTransformer
+_EMB_FAILED_AT: Dict[str, float] = {}  # model name -> monotonic time of the last failed load
+_EMBED_BATCH_SIZE = 64
+_DEFAULT_EMBED_MODEL = "models/all-MiniLM-L6-v2"  # the model the report's embedding alignment loads
+
 def _maybe_load_embedder(model_name: str = "models/all-MiniLM-L6-v2"):
-    global _EMB
-    if _EMB is not None:
-        return _EMB
+    """Load the sentence-transformers model once per model name (None without NumPy, which the
+    embedding cache and cosine math need)."""
+    if np is None:
+        return None
+    model = _EMB_CACHE.get(model_name)
+    if model is not None:
+        return model
+    failed_at = _EMB_FAILED_AT.get(model_name)
+    if failed_at is not None and time.monotonic() - failed_at < _LOAD_RETRY_SECONDS:
+        return None
     try:
         from sentence_transformers import SentenceTransformer
-        import os
         # Use local path if it exists, otherwise fall back to HuggingFace
         if os.path.exists(model_name):
-            _EMB = SentenceTransformer(model_name, device="cpu")
+            model = SentenceTransformer(model_name, device="cpu")
         else:
             # Fallback to HuggingFace if local model not found
-            _EMB = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2", device="cpu")
+            model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2", device="cpu")
     except Exception:
-        _EMB = None
-    return _EMB
-
-def _embed_alignment(question: str, answer: str, q_terms: List[str], idf: Dict[str, float],
-                     term_threshold: float = 0.5,
-                     model_name: str = "models/all-MiniLM-L6-v2") -> Dict[str, Optional[float]]:
-    """Calculate semantic alignment between question and answer using Sentence Transformers."""
-    model = _maybe_load_embedder(model_name)
-    if model is None or not question or not answer:
-        return {"cosine_embed": None, "answer_covers_question_sem": None}
-    from sentence_transformers import util as st_util
-    qa_emb = model.encode([question, answer], convert_to_tensor=True, normalize_embeddings=True)
-    cos = float(st_util.cos_sim(qa_emb[0], qa_emb[1]).item())
+        _EMB_FAILED_AT[model_name] = time.monotonic()
+        return None
+    _EMB_FAILED_AT.pop(model_name, None)
+    _EMB_CACHE[model_name] = model
+    return model
+
+_EMBED_CACHE_MAXSIZE = 8192
+_EMBED_CACHE: "OrderedDict[bytes, Any]" = OrderedDict()  # blake2b(model, text) -> fp16 unit embedding
+_EMBED_CACHE_LOCK = Lock()
+
+def _embed_key(model_name: str, text: str) -> bytes:
+    h = blake2b(model_name.encode("utf-8"), digest_size=16)
+    h.update(b"\0")
+    h.update((text or "").encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+def _encode_unit(model, texts: List[str], model_name: str = "models/all-MiniLM-L6-v2"):
+    """L2-normalized embeddings (float32 rows) for texts; only texts not seen before are encoded,
+    in one batched call.
+
+    Cached vectors are kept in float16 (half the memory and bytes moved per lookup) and widened
+    back to float32 for the cosine math; fresh vectors take the same round trip so hits and
+    misses score identically.
+    """
+    keys = [_embed_key(model_name, t) for t in texts]
+    found: Dict[bytes, Any] = {}
+    with _EMBED_CACHE_LOCK:
+        for k in keys:
+            if k not in found:
+                hit = _EMBED_CACHE.get(k)
+                if hit is not None:
+                    _EMBED_CACHE.move_to_end(k)
+                    found[k] = hit
+
+    missing = {k: t for k, t in zip(keys, texts) if k not in found}
+    if missing:
+        vecs = model.encode(list(missing.values()), convert_to_numpy=True, normalize_embeddings=True,
+                            batch_size=_EMBED_BATCH_SIZE)
+        with _EMBED_CACHE_LOCK:
+            for k, v in zip(missing, vecs):
+                v = np.asarray(v, dtype=np.float16)
+                v.flags.writeable = False  # shared between calls
+                found[k] = _EMBED_CACHE[k] = v
+            while len(_EMBED_CACHE) > _EMBED_CACHE_MAXSIZE:
+                _EMBED_CACHE.popitem(last=False)
+
+    return np.stack([found[k] for k in keys]).astype(np.float32)
+
+def _unit_cosines(rows, vec):
+    """Cosines of normalized embedding rows against one normalized vector (a float32 BLAS matvec)."""
+    return rows @ vec
+
+def _qa_alignment_from_embeddings(q_emb, a_emb, term_embs, q_terms: List[str], idf: Dict[str, float],
+                                  term_threshold: float) -> Dict[str, Optional[float]]:
+    cos = float(q_emb @ a_emb)  # already unit-normalized
     if not q_terms:
         return {"cosine_embed": round(cos, 4), "answer_covers_question_sem": 1.0}
-    term_embs = model.encode(q_terms, convert_to_tensor=True, normalize_embeddings=True)
-    sims = st_util.cos_sim(term_embs, qa_emb[1]).squeeze(1)
+    sims = _unit_cosines(term_embs, a_emb)
     total = sum(idf.get(t, 1.0) for t in q_terms) or 1.0
     covered = 0.0
     for term, sim in zip(q_terms, sims):
@@ -584,26 +726,9 @@ def _embed_alignment(question: str, answer: str, q_terms: List[str], idf: Dict[s
             covered += idf.get(term, 1.0)
     return {"cosine_embed": round(cos, 4), "answer_covers_question_sem": round(covered / total, 4)}
 
-def _embed_context_alignment(answer: str, contexts: List[str], 
-                            model_name: str = "models/all-MiniLM-L6-v2") -> Dict[str, Optional[float]]:
-    """Calculate semantic alignment between answer and retrieved contexts using Sentence Transformers."""
-    model = _maybe_load_embedder(model_name)
-    if model is None or not answer or not contexts:
-        return {"answer_context_similarity": None, "best_context_similarity": None}
-    
-    from sentence_transformers import util as st_util
-    
-    # Encode answer and all contexts
-    all_texts = [answer] + contexts
-    embeddings = model.encode(all_texts, convert_to_tensor=True, normalize_embeddings=True)
-    answer_emb = embeddings[0]
-    context_embs = embeddings[1:]
-    
+def _context_alignment_from_embeddings(answer_emb, context_embs) -> Dict[str, Optional[float]]:
     # Calculate similarity between answer and each context
-    similarities = []
-    for ctx_emb in context_embs:
-        sim = float(st_util.cos_sim(answer_emb, ctx_emb).item())
-        similarities.append(sim)
+    similarities = [float(sim) for sim in _unit_cosines(context_embs, answer_emb)]
     
     # Average similarity across all contexts
     avg_similarity = sum(similarities) / len(similarities) if similarities else 0.0
@@ -616,30 +741,115 @@ def _embed_context_alignment(answer: str, contexts: List[str],
         "best_context_similarity": round(best_similarity, 4)
     }
 
+def _embed_alignment(question: str, answer: str, q_terms: List[str], idf: Dict[str, float],
+                     term_threshold: float = 0.5,
+                     model_name: str = "models/all-MiniLM-L6-v2") -> Dict[str, Optional[float]]:
+    """Calculate semantic alignment between question and answer using Sentence Transformers."""
+    model = _maybe_load_embedder(model_name)
+    if model is None or not question or not answer:
+        return {"cosine_embed": None, "answer_covers_question_sem": None}
+    # One batched forward pass for question, answer and question terms
+    embs = _encode_unit(model, [question, answer, *q_terms], model_name)
+    return _qa_alignment_from_embeddings(embs[0], embs[1], embs[2:], q_terms, idf, term_threshold)
+
+def _embed_context_alignment(answer: str, contexts: List[str], 
+                            model_name: str = "models/all-MiniLM-L6-v2") -> Dict[str, Optional[float]]:
+    """Calculate semantic alignment between answer and retrieved contexts using Sentence Transformers."""
+    model = _maybe_load_embedder(model_name)
+    if model is None or not answer or not contexts:
+        return {"answer_context_similarity": None, "best_context_similarity": None}
+    
+    # Encode answer and all contexts in a single batched forward pass
+    embeddings = _encode_unit(model, [answer] + contexts, model_name)
+    return _context_alignment_from_embeddings(embeddings[0], embeddings[1:])
+
+def _embed_report_alignment(question: str, answer: str, q_terms: List[str], contexts: List[str],
+                            idf: Dict[str, float], term_threshold: float = 0.5,
+                            model_name: str = "models/all-MiniLM-L6-v2") -> Tuple[Dict[str, Optional[float]], Dict[str, Optional[float]]]:
+    """Question/answer and answer/context alignment from a single encode of every text the report needs."""
+    embed_align = {"cosine_embed": None, "answer_covers_question_sem": None}
+    context_align = {"answer_context_similarity": None, "best_context_similarity": None}
+    model = _maybe_load_embedder(model_name)
+    if model is None or not answer:
+        return embed_align, context_align
+
+    with_question = bool(question)
+    texts = [answer] + ([question, *q_terms] if with_question else []) + list(contexts)
+    embs = _encode_unit(model, texts, model_name)
+    a_emb = embs[0]
+    n_q = 1 + len(q_terms) if with_question else 0
+    if with_question:
+        embed_align = _qa_alignment_from_embeddings(embs[1], a_emb, embs[2:1 + n_q], q_terms, idf, term_threshold)
+    if contexts:
+        context_align = _context_alignment_from_embeddings(a_emb, embs[1 + n_q:])
+    return embed_align, context_align
+
 # =========================
 # Unsupported terms helpers
 # =========================
 
-def _unsupported_terms(ans_terms: List[str], ctx_terms_all: List[str], idf: Dict[str, float]) -> List[Dict[str, float]]:
-    a_ctr = Counter(ans_terms)
-    c_set = set(ctx_terms_all)
+# Distinct-term count above which unsupported-term impacts are ranked on NumPy arrays
+_NUMPY_MIN_TERMS = 20
+
+def _rank_unsupported(a_ctr: Counter, idf: Dict[str, float]) -> List[Dict[str, float]]:
+    """Unsupported-term items for an already-filtered counter, ordered by (-count*idf, term)."""
+    if np is not None and len(a_ctr) > _NUMPY_MIN_TERMS:
+        # pre-sorting by term keeps the (-impact, term) tie-break under a stable argsort
+        terms = sorted(a_ctr)
+        cnts = np.fromiter((a_ctr[t] for t in terms), dtype=np.int64, count=len(terms))
+        idfs = np.fromiter((idf.get(t, 1.0) for t in terms), dtype=np.float64, count=len(terms))
+        impacts = cnts * idfs
+        return [
+            {"term": terms[i], "count": int(cnts[i]), "idf": round(float(idfs[i]), 4),
+             "impact": round(float(impacts[i]), 4)}
+            for i in np.argsort(-impacts, kind="stable")
+        ]
     items = []
     for t, cnt in a_ctr.items():
-        if t not in c_set:
-            items.append({"term": t, "count": cnt, "idf": idf.get(t, 1.0), "impact": cnt * idf.get(t, 1.0)})
+        items.append({"term": t, "count": cnt, "idf": idf.get(t, 1.0), "impact": cnt * idf.get(t, 1.0)})
     items.sort(key=lambda x: (-x["impact"], x["term"]))
     for it in items:
         it["idf"] = round(it["idf"], 4)
         it["impact"] = round(it["impact"], 4)
     return items
 
-def _unsupported_terms_per_sentence(answer: str, ctx_terms_all: List[str], idf: Dict[str, float]) -> List[Dict[str, Any]]:
-    out = []
-    for sent in _split_sentences(answer):
-        s_terms = _informative_terms(_tokens(sent))
-        items = _unsupported_terms(s_terms, ctx_terms_all, idf)
-        out.append({"sentence": sent, "unsupported_terms": items})
-    return out
+def _unsupported_terms(ans_terms: Union[List[str], Counter], ctx_terms_all: Union[List[str], FrozenSet[str]],
+                       idf: Dict[str, float]) -> List[Dict[str, float]]:
+    a_ctr = _as_counter(ans_terms)
+    c_set = _as_term_set(ctx_terms_all)
+    return _rank_unsupported(Counter({t: cnt for t, cnt in a_ctr.items() if t not in c_set}), idf)
+
+def _support_split(answer: str, sentences: List[str], ctx_vocab: AbstractSet[str], idf: Dict[str, float]):
+    """
+    One pass over the answer's informative tokens, bucketing each by context-vocabulary membership.
+
+    Returns (supported_terms, supported_terms_per_sentence, unsupported_terms,
+    unsupported_terms_per_sentence): supported terms with character spans for UI highlighting
+    and unsupported terms ranked by impact, both globally and per sentence.
+    """
+    supported_counts = Counter()
+    unsupported_counts = Counter()
+    supported_per_sentence = []
+    unsupported_per_sentence = []
+    for sent in sentences:
+        per_sent = []
+        sent_unsupported = Counter()
+        offset = answer.find(sent)  # deterministic; safe because we split by exact substring
+        for norm, s, e, _ in _normalized_token_spans(sent):
+            if norm in ctx_vocab:
+                supported_counts[norm] += 1
+                per_sent.append({"term": norm, "start": offset + s, "end": offset + e})
+            else:
+                sent_unsupported[norm] += 1
+        unsupported_counts.update(sent_unsupported)
+        supported_per_sentence.append({"sentence": sent, "supported_terms": per_sent})
+        unsupported_per_sentence.append({"sentence": sent, "unsupported_terms": _rank_unsupported(sent_unsupported, idf)})
+
+    supported_global = [
+        {"term": t, "count": c, "idf": round(idf.get(t, 1.0), 4)}
+        for t, c in sorted(supported_counts.items(), key=lambda kv: (-kv[1]*idf.get(kv[0],1.0), kv[0]))
+    ]
+    return supported_global, supported_per_sentence, _rank_unsupported(unsupported_counts, idf), unsupported_per_sentence
 
 def _unsupported_numbers(answer: str, contexts: List[str]) -> List[str]:
     ans_nums = _extract_numbers_and_units(answer)
@@ -650,10 +860,67 @@ def _unsupported_numbers(answer: str, contexts: List[str]) -> List[str]:
         ctx_nums |= _extract_numbers_and_units(s or "")
     return [f"{k}:{v}" for (k, v) in ans_nums if (k, v) not in ctx_nums]
 
+# =========================
+# Report cache (exact-match on inputs)
+# =========================
+
+_REPORT_CACHE_MAXSIZE = 512
+_REPORT_CACHE: "OrderedDict[bytes, Any]" = OrderedDict()
+_REPORT_CACHE_LOCK = Lock()
+
+def _report_cache_key(question: str, answer: str, retrieved_contexts: List[str],
+                      args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bytes:
+    """blake2b digest of the texts (length-prefixed, so boundaries are unambiguous) plus the options."""
+    h = blake2b(digest_size=16)
+    for part in (question or "", answer or "", *((c or "") for c in retrieved_contexts or ())):
+        b = part.encode("utf-8", "surrogatepass")
+        h.update(len(b).to_bytes(8, "little"))
+        h.update(b)
+    h.update(repr((len(retrieved_contexts or ()), args, sorted(kwargs.items()))).encode("utf-8"))
+    return h.digest()
+
+def _report_models_ready(options: Dict[str, Any]) -> bool:
+    """False when the report asked for spaCy / the embedder but the model is not loaded, i.e. the
+    result holds fallback values that a later (retried) load would change."""
+    if options.get("use_spacy_ner") and not options.get("fast") and _SPACY_CACHE.get(options.get("spacy_model")) is None:
+        return False
+    if options.get("use_embed_alignment") and _EMB_CACHE.get(_DEFAULT_EMBED_MODEL) is None:
+        return False
+    return True
+
+def _cached_report(fn):
+    """LRU cache for the report: repeated (question, answer, contexts, options) calls are served
+    from memory. Each hit returns a deep copy so callers may mutate it freely; the report computed
+    on a miss is stored as-is, so it must be treated as read-only. Reports built while a requested
+    model was unavailable are not stored, so they are recomputed once the model loads."""
+    signature = inspect.signature(fn)
+
+    @wraps(fn)
+    def wrapper(question, answer, retrieved_contexts, *args, **kwargs):
+        key = _report_cache_key(question, answer, retrieved_contexts, args, kwargs)
+        with _REPORT_CACHE_LOCK:
+            hit = _REPORT_CACHE.get(key)
+            if hit is not None:
+                _REPORT_CACHE.move_to_end(key)
+        if hit is not None:
+            return deepcopy(hit)
+        result = fn(question, answer, retrieved_contexts, *args, **kwargs)
+        bound = signature.bind(question, answer, retrieved_contexts, *args, **kwargs)
+        bound.apply_defaults()
+        if _report_models_ready(bound.arguments):
+            with _REPORT_CACHE_LOCK:
+                _REPORT_CACHE[key] = result
+                while len(_REPORT_CACHE) > _REPORT_CACHE_MAXSIZE:
+                    _REPORT_CACHE.popitem(last=False)
+        return result
+    wrapper.cache_clear = _REPORT_CACHE.clear
+    return wrapper
+
 # =========================
 # Main advanced function
 # =========================
 
+@_cached_report
 def context_utilization_report_with_entities(
     question: str,
     answer: str,
@@ -662,7 +929,8 @@ def context_utilization_report_with_entities(
     use_embed_alignment: bool = False,    # set True if sentence-transformers installed
     embed_term_threshold: float = 0.5,
     use_spacy_ner: bool = True,           # Default to True for better NER
-    spacy_model: str = "en_core_web_sm"
+    spacy_model: str = "en_core_web_sm",
+    fast: bool = False                    # skip UI-only / entity work (see Args)
 ) -> Dict[str, Any]:
     """
     Advanced context utilization analysis with entity extraction and sentence similarity.
@@ -680,6 +948,9 @@ def context_utilization_report_with_entities(
         embed_term_threshold: Threshold for embedding-based term coverage
         use_spacy_ner: Whether to use spaCy NER (requires spaCy model)
         spacy_model: spaCy model name to use
+        fast: Cheap path for callers that only need the lexical scores. Skips entity
+            alignment, supported-term highlighting and per-sentence unsupported terms;
+            those keys are returned as empty stubs and the summary omits the entity part.
         
     Returns:
         Dictionary containing comprehensive metrics including:
@@ -720,27 +991,34 @@ def context_utilization_report_with_entities(
             "summary": "N/A (No answer generated)"
         }
 
-    # Tokenize
-    q_tokens = _tokens(question or "")
-    a_tokens = _tokens(answer or "")
-    ctx_tokens_list = [_tokens(s or "") for s in (retrieved_contexts or [])]
-
-    q_terms = _informative_terms(q_tokens)
-    a_terms = _informative_terms(a_tokens)
-    ctx_terms_list = [_informative_terms(t) for t in ctx_tokens_list]
-    all_ctx_terms = [t for lst in ctx_terms_list for t in lst]
-
-    # Build IDF over contexts + Q + A
-    idf = _build_idf((ctx_terms_list or []) + [q_terms, a_terms])
+    # Tokenize (memoized per distinct string, so helpers below reuse these passes)
+    q_terms = _text_terms(question or "")
+    a_terms = _text_terms(answer or "")
+    ctx_terms_list = [_text_terms(s or "") for s in (retrieved_contexts or [])]
+    # Answer sentences, split and tokenized once for every sentence-level metric
+    sentences = _split_sentences(answer)
+    sent_terms = [_text_terms(sent) for sent in sentences]
+
+    # Term counters, built once and shared by every weighted metric below
+    q_counter = Counter(q_terms)
+    a_counter = Counter(a_terms)
+    all_ctx_counter = Counter()  # bag over every context, without an intermediate flat list
+    for lst in ctx_terms_list:
+        all_ctx_counter.update(lst)
+    ctx_vocab = frozenset(all_ctx_counter)  # O(1) "is supported" checks
+
+    # Build IDF over contexts + Q + A (cached across reports on the same inputs)
+    idf = _cached_idf(tuple(ctx_terms_list) + (q_terms, a_terms))
 
     # If no contexts, still compute alignment and unsupported vs empty
     if not retrieved_contexts:
-        vq, va = _tfidf_vector(q_terms, idf), _tfidf_vector(a_terms, idf)
-        qr_cos = _cosine(vq, va)
-        qr_cov = _weighted_recall(Counter(a_terms), Counter(q_terms), idf)
+        qr_cos = _tfidf_cosine(q_terms, a_terms, idf)
+        qr_cov = _weighted_recall(a_counter, q_counter, idf)
         embed_align = {"cosine_embed": None, "answer_covers_question_sem": None}
         if use_embed_alignment:
             embed_align = _embed_alignment(question, answer, q_terms, idf, embed_term_threshold)
+        # every answer term is unsupported against an empty context vocabulary
+        _, _, unsupported, unsupported_ps = _support_split(answer, sentences, ctx_vocab, idf)
         return {
             "precision_token": None,
             "recall_context": None,
@@ -749,7 +1027,7 @@ def context_utilization_report_with_entities(
             "supported_entities": {"items": [], "by_type": {}, "count": 0},
             "supported_terms": [],
             "supported_terms_per_sentence": [],
-            "per_sentence": [0.0 for _ in _split_sentences(answer)],
+            "per_sentence": [0.0 for _ in sentences],
             "qr_alignment": {
                 "cosine_tfidf": round(qr_cos, 4),
                 "answer_covers_question": round(qr_cov, 4),
@@ -760,59 +1038,61 @@ def context_utilization_report_with_entities(
                 "answer_context_similarity": None,
                 "best_context_similarity": None
             },
-            "unsupported_terms": _unsupported_terms(a_terms, [], idf),
-            "unsupported_terms_per_sentence": _unsupported_terms_per_sentence(answer, [], idf),
+            "unsupported_terms": unsupported,
+            "unsupported_terms_per_sentence": unsupported_ps,
             "unsupported_numbers": _unsupported_numbers(answer, []),
             "summary": "N/A (No retrieved context provided)."
         }
 
     # ---- Grounding vs contexts
-    precision_token = _weighted_precision(a_terms, all_ctx_terms, idf)
+    precision_token = _weighted_precision(a_counter, all_ctx_counter, idf)
 
     # ---- Best-context recall
     if use_bm25_for_best:
-        best_i = _pick_best_context_by_bm25(a_terms, ctx_terms_list, idf)
+        best_i = _pick_best_context_by_bm25(a_counter, ctx_terms_list, idf)
     else:
         best_i, best_sc = 0, float("-inf")
         for i, terms in enumerate(ctx_terms_list):
-            sc = _weighted_precision(terms, a_terms, idf)
+            sc = _weighted_precision(terms, a_counter, idf)
             if sc > best_sc:
                 best_sc, best_i = sc, i
-    best_ctx_terms = ctx_terms_list[best_i] if ctx_terms_list else []
-    recall_context = _weighted_recall(Counter(a_terms), Counter(best_ctx_terms), idf)
+    best_ctx_counter = Counter(ctx_terms_list[best_i] if ctx_terms_list else [])
+    recall_context = _weighted_recall(a_counter, best_ctx_counter, idf)
 
     # ---- Numeric & Entity alignment
     numeric_match = _numeric_match_only(answer, retrieved_contexts)
-    ent = _entity_alignment(answer, retrieved_contexts, use_spacy_ner=use_spacy_ner, spacy_model=spacy_model)
-    entity_match = ent["match"]
-    supported_entities = ent["supported_entities"]
+    if fast:
+        entity_match = {"overall": None, "by_type": {}, "unsupported": []}
+        supported_entities = {"items": [], "by_type": {}, "count": 0}
+    else:
+        ent = _entity_alignment(answer, retrieved_contexts, use_spacy_ner=use_spacy_ner, spacy_model=spacy_model)
+        entity_match = ent["match"]
+        supported_entities = ent["supported_entities"]
 
     # ---- Per-sentence precision (vs ALL context)
     per_sentence = []
-    for sent in _split_sentences(answer):
-        s_terms = _informative_terms(_tokens(sent))
-        p = _weighted_precision(s_terms, all_ctx_terms, idf) if s_terms else 0.0
+    for s_terms in sent_terms:
+        p = _weighted_precision(s_terms, all_ctx_counter, idf) if s_terms else 0.0
         per_sentence.append(round(p, 4))
 
     # ---- Q↔A alignment
-    vq, va = _tfidf_vector(q_terms, idf), _tfidf_vector(a_terms, idf)
-    qr_cosine = _cosine(vq, va)
-    qr_answer_coverage = _weighted_recall(Counter(a_terms), Counter(q_terms), idf)
+    qr_cosine = _tfidf_cosine(q_terms, a_terms, idf)
+    qr_answer_coverage = _weighted_recall(a_counter, q_counter, idf)
+    # ---- Q↔A and Answer↔Context alignment (semantic similarity), one encode for both
     embed_align = {"cosine_embed": None, "answer_covers_question_sem": None}
-    if use_embed_alignment:
-        embed_align = _embed_alignment(question, answer, q_terms, idf, embed_term_threshold)
-    
-    # ---- Answer↔Context alignment (semantic similarity)
     context_align = {"answer_context_similarity": None, "best_context_similarity": None}
     if use_embed_alignment:
-        context_align = _embed_context_alignment(answer, retrieved_contexts)
-
-    # ---- Supported terms (for UI highlighting)
-    supported_terms, supported_terms_per_sentence = _collect_supported_terms(answer, all_ctx_terms, idf)
-
-    # ---- Unsupported (lexical & numeric)
-    unsupported = _unsupported_terms(a_terms, all_ctx_terms, idf)
-    unsupported_ps = _unsupported_terms_per_sentence(answer, all_ctx_terms, idf)
+        embed_align, context_align = _embed_report_alignment(
+            question, answer, q_terms, retrieved_contexts, idf, embed_term_threshold)
+
+    # ---- Supported terms (for UI highlighting) and unsupported (lexical & numeric):
+    # one pass over the answer tokens yields both sides
+    if fast:
+        supported_terms, supported_terms_per_sentence, unsupported_ps = [], [], []
+        unsupported = _unsupported_terms(a_counter, ctx_vocab, idf)
+    else:
+        supported_terms, supported_terms_per_sentence, unsupported, unsupported_ps = \
+            _support_split(answer, sentences, ctx_vocab, idf)
     unsupported_nums = _unsupported_numbers(answer, retrieved_contexts)
 
     # ---- Summary
@@ -820,7 +1100,9 @@ def context_utilization_report_with_entities(
     rec = round(recall_context * 100, 1)
     nump = round(numeric_match * 100, 1)
     entp = round((entity_match["overall"] if entity_match["overall"] is not None else 0.0) * 100, 1)
-    parts = [f"{pct}% grounded", f"{rec}% best-context recall", f"{nump}% numeric", f"{entp}% entity"]
+    parts = [f"{pct}% grounded", f"{rec}% best-context recall", f"{nump}% numeric"]
+    if not fast:
+        parts.append(f"{entp}% entity")
     if use_embed_alignment and embed_align["cosine_embed"] is not None:
         parts.append(f"Q↔A embed {round(embed_align['cosine_embed'], 2)}")
         if context_align["answer_context_similarity"] is not None:
@@ -854,44 +1136,155 @@ def context_utilization_report_with_entities(
         "summary": summary
     }
 
+# =========================
+# Batch evaluation (process pool)
+# =========================
+
+def _init_report_worker(use_spacy_ner: bool, spacy_model: str) -> None:
+    """Pool initializer: load the spaCy pipeline once per worker instead of on its first row."""
+    if use_spacy_ner:
+        _maybe_load_spacy(spacy_model)
+
+def _report_row(row: Tuple[str, str, List[str], Dict[str, Any]]) -> Dict[str, Any]:
+    question, answer, contexts, kwargs = row
+    return context_utilization_report_with_entities(question, answer, contexts, **kwargs)
+
+def context_utilization_report_batch(items: List[Tuple[str, str, List[str]]],
+                                     n_jobs: int = 1,
+                                     **kwargs) -> List[Dict[str, Any]]:
+    """
+    Run context_utilization_report_with_entities over many (question, answer, contexts) rows.
+
+    Rows are independent, so they can be fanned out to a process pool (the report is pure-Python
+    and CPU bound, threads would serialize on the GIL). Each worker loads spaCy once up front.
+    The pool is opt-in and uses the spawn start method, so the caller's process (its held locks,
+    loaded spaCy/torch state) is never forked. Spawned workers re-import the __main__ module, so
+    only enable it from a script whose entry point is guarded by `if __name__ == "__main__":`
+    -- never from the API server, whose main.py builds models at import.
+
+    Args:
+        items: (question, answer, retrieved_contexts) tuples
+        n_jobs: worker processes; 1 (default) runs serially in this process, -1 uses every core
+        **kwargs: forwarded to context_utilization_report_with_entities
+
+    Returns:
+        Reports in the same order as items
+    """
+    rows = [(q, a, c, kwargs) for q, a, c in items]
+    workers = (os.cpu_count() or 1) if n_jobs is None or n_jobs < 0 else n_jobs
+    workers = min(workers, len(rows))
+    if workers <= 1:
+        return [_report_row(row) for row in rows]
+
+    chunksize = max(1, len(rows) // (workers * 4))
+    init_args = (kwargs.get("use_spacy_ner", True), kwargs.get("spacy_model", "en_core_web_sm"))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_report_worker, initargs=init_args) as pool:
+        return list(pool.map(_report_row, rows, chunksize=chunksize))
+
+@dataclass(eq=False)
+class ContextUtilizationResult(Mapping):
+    """Typed, slotted view of a calculate_context_utilization_percentage() report.
+
+    The function itself returns the plain dict (JSON-serializable, isinstance dict); build this
+    with ContextUtilizationResult(**report) for attribute access. It is a read-only Mapping over
+    the field names, and as_dict() gives the plain dictionary back.
+    """
+    __slots__ = (
+        "precision_token", "recall_context", "numeric_match", "entity_match", "supported_entities",
+        "supported_terms", "supported_terms_per_sentence", "per_sentence", "qr_alignment",
+        "context_alignment", "unsupported_terms", "unsupported_terms_per_sentence",
+        "unsupported_numbers", "summary",
+    )
+    precision_token: Optional[float]
+    recall_context: Optional[float]
+    numeric_match: Optional[float]
+    entity_match: Dict[str, Any]
+    supported_entities: Dict[str, Any]
+    supported_terms: List[Dict[str, Any]]
+    supported_terms_per_sentence: List[Dict[str, Any]]
+    per_sentence: List[float]
+    qr_alignment: Dict[str, Optional[float]]
+    context_alignment: Dict[str, Optional[float]]
+    unsupported_terms: List[Dict[str, Any]]
+    unsupported_terms_per_sentence: List[Dict[str, Any]]
+    unsupported_numbers: List[str]
+    summary: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+
 def calculate_context_utilization_percentage(answer: str, context_snippets: List[str]) -> Dict[str, Any]:
     """
-    Calculate advanced context utilization metrics with entity extraction and sentence similarity.
+    Calculate lexical context utilization metrics for an answer.
     
-    This function provides comprehensive metrics for how well the answer utilizes the
-    retrieved context snippets, including precision, recall, numeric matching,
-    entity extraction (regex + spaCy), and sentence similarity using MiniLM.
+    This function provides metrics for how well the answer utilizes the retrieved
+    context snippets (precision, recall, numeric matching, per-sentence precision).
+    It runs the report's fast path: entity alignment and term highlighting are skipped,
+    so use context_utilization_report_with_entities directly when those are needed.
     
     Args:
         answer: The generated answer text
         context_snippets: List of context snippets retrieved for the answer
         
     Returns:
-        Dictionary containing:
+        Dictionary containing (ContextUtilizationResult(**result) gives a typed view):
         - precision_token: IDF-weighted precision of answer terms vs context
         - recall_context: IDF-weighted recall of best snippet into answer
         - numeric_match: Fraction of numeric facts in answer present in context
-        - entity_match: Entity coverage metrics with regex + spaCy NER
+        - entity_match: Empty stub (overall None) on this fast path
         - per_sentence: List of sentence-level precision scores
         - qr_alignment: Question-answer alignment metrics
         - context_alignment: Answer-context semantic similarity metrics
         - unsupported_terms: Terms in answer not found in context
-        - unsupported_terms_per_sentence: Per-sentence unsupported terms
+        - unsupported_terms_per_sentence: Empty on this fast path
         - unsupported_numbers: Numeric facts in answer not in context
         - summary: Human-readable summary of metrics
     """
     # Use the advanced function with default settings
-    return context_utilization_report_with_entities(
+    report = context_utilization_report_with_entities(
         question="",  # No question context for backward compatibility
         answer=answer,
         retrieved_contexts=context_snippets,
         use_bm25_for_best=True,
         use_embed_alignment=False,  # Disable by default for performance
         use_spacy_ner=False,  # Disable by default for performance
-        spacy_model="en_core_web_sm"
+        spacy_model="en_core_web_sm",
+        fast=True  # lexical scores only; entity/highlighting fields come back empty
     )
+    return report
 
 
+def _word_count(text: str, limit: Optional[int] = None) -> int:
+    """len(text.split()) without allocating the word list; stops counting at `limit` if given."""
+    words = _RE_NONSPACE.finditer(text)
+    if limit is not None:
+        words = islice(words, limit)
+    return sum(1 for _ in words)
+
+# Confidence ladder: a level is reached when BOTH counts strictly exceed its thresholds
+_CONFIDENCE_LEVELS = ("Low", "Medium", "High")
+_CONFIDENCE_ANSWER_WORDS = (5, 10)
+_CONFIDENCE_CONTEXT_WORDS = (20, 50)
+
 def calculate_confidence_score(answer: str, context: str, answer_type: str) -> str:
     """
     Calculate confidence score based on answer quality and context relevance using heuristic rules.
@@ -927,17 +1320,14 @@ def calculate_confidence_score(answer: str, context: str, answer_type: str) -> s
     if answer_type == "abstain":
         return "Low"
     
-    # Simple heuristics for confidence scoring
-    answer_length = len(answer.split())
-    context_length = len(context.split())
+    # Simple heuristics for confidence scoring; counts past the top threshold don't matter
+    answer_length = _word_count(answer, _CONFIDENCE_ANSWER_WORDS[-1] + 1)
+    context_length = _word_count(context, _CONFIDENCE_CONTEXT_WORDS[-1] + 1)
     
     # High confidence if answer is substantial and context is relevant
-    if answer_length > 10 and context_length > 50:
-        return "High"
-    elif answer_length > 5 and context_length > 20:
-        return "Medium"
-    else:
-        return "Low"
+    level = min(bisect_left(_CONFIDENCE_ANSWER_WORDS, answer_length),
+                bisect_left(_CONFIDENCE_CONTEXT_WORDS, context_length))
+    return _CONFIDENCE_LEVELS[level]
 
 
 def calculate_faithfulness_score(answer: str, context: str) -> float:
@@ -973,13 +1363,13 @@ def calculate_faithfulness_score(answer: str, context: str) -> float:
         return 0.0
     
     # Simple word overlap calculation
-    answer_words = set(re.findall(r'\b\w+\b', answer.lower()))
-    context_words = set(re.findall(r'\b\w+\b', context.lower()))
-    
-    if not answer_words or not context_words:
+    answer_words = set(_PLAIN_WORD_RE.findall(answer.lower()))
+    if not answer_words:
         return 0.0
     
-    overlap = len(answer_words.intersection(context_words))
+    # Stream context words against the (small) answer set instead of hashing the whole
+    # context into its own set; a context without words simply yields no overlap
+    overlap = len(answer_words.intersection(_PLAIN_WORD_RE.findall(context.lower())))
     return min(overlap / len(answer_words), 1.0)
 
 
@@ -1017,8 +1407,8 @@ def calculate_completeness_score(answer: str, question: str) -> float:
         return 0.0
     
     # Simple heuristic: longer answers are more complete
-    answer_length = len(answer.split())
-    question_length = len(question.split())
+    answer_length = _word_count(answer, 30)
+    question_length = _word_count(question, 5)
     
     # Normalize by question complexity
     if question_length < 5:
@@ -17,13 +17,136 @@ RAG Utilities for metadata extraction and document processing
 Author: Emad Noorizadeh
 """
 
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional, Set, Tuple
 import json
 from datetime import datetime
 from typing import Dict, Any, List
 from pathlib import Path
 
+try:
+    import re2  # optional: google-re2, linear-time DFA matching for the full-text scans
+except ImportError:
+    re2 = None
+
+
+# Patterns used per document, compiled once at import
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# (literal every match must contain, pattern): the literal is a C-speed prefilter that
+# lets a document skip a full regex pass when it cannot match
+_RE_DATES = (
+    ('-', re.compile(r'\b\d{4}-\d{2}-\d{2}\b')),  # YYYY-MM-DD
+    ('/', re.compile(r'\b\d{2}/\d{2}/\d{4}\b')),  # MM/DD/YYYY
+    (', ', re.compile(r'\b\w+ \d{1,2}, \d{4}\b')),  # Month DD, YYYY
+)
+_RE_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_RE_URL = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+
+# Category -> keywords; a line belongs to a category if it contains any keyword as a substring.
+# Each keyword list is one compiled alternation, so a line is classified with one C-level
+# search per category instead of a Python-level `in` test per keyword.
+_CATEGORY_KEYWORDS = (
+    ('financial', ('bank', 'financial', 'credit', 'loan', 'account')),
+    ('rewards', ('reward', 'bonus', 'deal', 'offer')),
+    ('service', ('service', 'support', 'help')),
+)
+_RE_CATEGORIES = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in _CATEGORY_KEYWORDS
+)
+
+
+def _re2_twin(rx):
+    """RE2 compile of a stdlib pattern, or None when re2 is missing or rejects the pattern."""
+    if re2 is None:
+        return None
+    try:
+        return re2.compile(rx.pattern)
+    except Exception:
+        return None
+
+
+# RE2's \b and \w are ASCII-only, so the twins are only used on ASCII text where both
+# engines agree; anything else goes through the stdlib pattern
+_RE2_EMAIL = _re2_twin(_RE_EMAIL)
+_RE2_URL = _re2_twin(_RE_URL)
+
+
+def _findall(rx, rx2, text: str) -> List[str]:
+    if rx2 is not None and text.isascii():
+        return rx2.findall(text)
+    return rx.findall(text)
+
+
+def _chroma_list(value: list) -> str:
+    # Convert lists to comma-separated strings
+    if all(isinstance(item, (str, int, float)) for item in value):
+        return ', '.join(str(item) for item in value)
+    # For complex lists, convert to JSON string
+    return json.dumps(value)
+
+
+def _chroma_value_fallback(value: Any) -> Any:
+    """isinstance-based conversion for values whose exact type is not in _CHROMA_CONVERTERS"""
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    if isinstance(value, list):
+        return _chroma_list(value)
+    if isinstance(value, dict):
+        # Convert dicts to JSON string
+        return json.dumps(value)
+    # Convert other types to string
+    return str(value)
+
+
+def _chroma_passthrough(value: Any) -> Any:
+    return value
+
+
+# Exact type -> ChromaDB conversion; bool is listed because it passes through like int
+_CHROMA_CONVERTERS = {
+    str: _chroma_passthrough,
+    int: _chroma_passthrough,
+    float: _chroma_passthrough,
+    bool: _chroma_passthrough,
+    type(None): _chroma_passthrough,
+    list: _chroma_list,
+    dict: json.dumps,
+}
+
+
+# metadata_extraction.* options read by MetadataExtractor (cached as self._cfg_<name>)
+_METADATA_OPTIONS = (
+    'extract_headings', 'extract_links', 'extract_dates', 'extract_emails',
+    'extract_urls', 'extract_categories', 'max_heading_lines', 'max_category_lines',
+)
+
+# Below this many documents a process pool costs more to start than it saves
+_PARALLEL_METADATA_MIN_DOCS = 256
+
+_WORKER_EXTRACTOR = None
+
+
+def _snapshot_config(options: Dict[str, Any], section: str, key: str) -> Any:
+    """config_getter over a MetadataExtractor.config_snapshot() dict"""
+    return options.get(key)
+
+
+def _init_metadata_worker(options: Dict[str, Any]) -> None:
+    """Pool initializer: build one extractor per worker from the parent's config snapshot."""
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = MetadataExtractor(partial(_snapshot_config, options))
+
+
+def _extract_metadata_row(row: Tuple[str, str]) -> Dict[str, Any]:
+    text, processed_at = row
+    return _WORKER_EXTRACTOR.extract_content_metadata(text, processed_at)
+
 
 class MetadataExtractor:
     """Handles extraction of metadata from document content"""
@@ -36,18 +159,34 @@ class MetadataExtractor:
             config_getter: Function to get configuration values (e.g., get_config)
         """
         self.get_config = config_getter
+        self.refresh_config()
+    
+    def refresh_config(self) -> None:
+        """Re-read the metadata extraction options (cached so documents don't re-query config)"""
+        for name in _METADATA_OPTIONS:
+            setattr(self, f"_cfg_{name}", self.get_config("data", f"metadata_extraction.{name}"))
     
-    def extract_content_metadata(self, text: str) -> Dict[str, Any]:
-        """Extract metadata from document content using configuration options"""
-        # Get configuration options
-        extract_headings = self.get_config("data", "metadata_extraction.extract_headings")
-        extract_links = self.get_config("data", "metadata_extraction.extract_links")
-        extract_dates = self.get_config("data", "metadata_extraction.extract_dates")
-        extract_emails = self.get_config("data", "metadata_extraction.extract_emails")
-        extract_urls = self.get_config("data", "metadata_extraction.extract_urls")
-        extract_categories = self.get_config("data", "metadata_extraction.extract_categories")
-        max_heading_lines = self.get_config("data", "metadata_extraction.max_heading_lines")
-        max_category_lines = self.get_config("data", "metadata_extraction.max_category_lines")
+    def config_snapshot(self) -> Dict[str, Any]:
+        """Currently cached options keyed like config (picklable, used to seed worker processes)"""
+        return {f"metadata_extraction.{name}": getattr(self, f"_cfg_{name}") for name in _METADATA_OPTIONS}
+    
+    def extract_content_metadata(self, text: str, processed_at: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract metadata from document content using configuration options
+        
+        Args:
+            text: Document text
+            processed_at: ISO timestamp to record; batch callers pass one shared value (defaults to now)
+        """
+        # Configuration options, cached by refresh_config()
+        extract_headings = self._cfg_extract_headings
+        extract_links = self._cfg_extract_links
+        extract_dates = self._cfg_extract_dates
+        extract_emails = self._cfg_extract_emails
+        extract_urls = self._cfg_extract_urls
+        extract_categories = self._cfg_extract_categories
+        max_heading_lines = self._cfg_max_heading_lines
+        max_category_lines = self._cfg_max_category_lines
         
         metadata = {}
         
@@ -80,7 +219,7 @@ class MetadataExtractor:
         if extract_categories:
             categories = self._extract_categories(lines, max_category_lines)
             if categories:
-                metadata['categories'] = list(set(categories))
+                metadata['categories'] = sorted(categories)
         
         # Extract document structure info
         metadata.update(self._extract_document_structure(text, lines))
@@ -103,14 +242,14 @@ class MetadataExtractor:
                 metadata['urls'] = urls[:5]  # Limit to 5 URLs
         
         # Add processing timestamp
-        metadata['processed_at'] = datetime.now().isoformat()
+        metadata['processed_at'] = processed_at if processed_at is not None else datetime.now().isoformat()
         
         # Convert complex metadata to ChromaDB-compatible format
         return self._convert_metadata_for_chromadb(metadata)
     
     def _extract_link_metadata(self, first_line: str) -> Dict[str, Any]:
         """Extract metadata from markdown link format"""
-        link_match = re.match(r'\[([^\]]+)\]\(([^)]+)\)', first_line)
+        link_match = _RE_LINK.match(first_line)
         if link_match:
             return {
                 'link_text': link_match.group(1),
@@ -141,21 +280,23 @@ class MetadataExtractor:
                 })
         return headings
     
-    def _extract_categories(self, lines: List[str], max_lines: int) -> List[str]:
+    def _extract_categories(self, lines: List[str], max_lines: int) -> Set[str]:
         """Extract categories from document content"""
-        categories = []
+        categories = set()
         for line in lines[:max_lines]:
             line = line.strip().lower()
-            if any(keyword in line for keyword in ['bank', 'financial', 'credit', 'loan', 'account']):
-                categories.append('financial')
-            if any(keyword in line for keyword in ['reward', 'bonus', 'deal', 'offer']):
-                categories.append('rewards')
-            if any(keyword in line for keyword in ['service', 'support', 'help']):
-                categories.append('service')
+            for category, pattern in _RE_CATEGORIES:
+                # A category already found needs no further searches
+                if category not in categories and pattern.search(line):
+                    categories.add(category)
+            if len(categories) == len(_RE_CATEGORIES):
+                break
         return categories
     
     def _extract_document_structure(self, text: str, lines: List[str]) -> Dict[str, Any]:
         """Extract basic document structure information"""
+        # lines comes from the caller's single split; str.split() stays as the word counter
+        # because it is exact and several times faster than counting \S+ matches
         return {
             'line_count': len(lines),
             'word_count': len(text.split()),
@@ -164,16 +305,10 @@ class MetadataExtractor:
     
     def _extract_dates(self, text: str) -> Dict[str, Any]:
         """Extract dates from document content"""
-        date_patterns = [
-            r'\b\d{4}-\d{2}-\d{2}\b',  # YYYY-MM-DD
-            r'\b\d{2}/\d{2}/\d{4}\b',  # MM/DD/YYYY
-            r'\b\w+ \d{1,2}, \d{4}\b'  # Month DD, YYYY
-        ]
-        
         dates_found = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text)
-            dates_found.extend(matches)
+        for literal, pattern in _RE_DATES:
+            if literal in text:
+                dates_found.extend(pattern.findall(text))
         
         if dates_found:
             return {
@@ -184,34 +319,24 @@ class MetadataExtractor:
     
     def _extract_emails(self, text: str) -> List[str]:
         """Extract email addresses from document content"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        return re.findall(email_pattern, text)
+        if '@' not in text:
+            return []
+        return _findall(_RE_EMAIL, _RE2_EMAIL, text)
     
     def _extract_urls(self, text: str) -> List[str]:
         """Extract URLs from document content"""
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        return re.findall(url_pattern, text)
+        if '://' not in text:
+            return []
+        return _findall(_RE_URL, _RE2_URL, text)
     
     def _convert_metadata_for_chromadb(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Convert complex metadata to ChromaDB-compatible format"""
         converted = {}
         
         for key, value in metadata.items():
-            if isinstance(value, (str, int, float, type(None))):
-                converted[key] = value
-            elif isinstance(value, list):
-                # Convert lists to comma-separated strings
-                if all(isinstance(item, (str, int, float)) for item in value):
-                    converted[key] = ', '.join(str(item) for item in value)
-                else:
-                    # For complex lists, convert to JSON string
-                    converted[key] = json.dumps(value)
-            elif isinstance(value, dict):
-                # Convert dicts to JSON string
-                converted[key] = json.dumps(value)
-            else:
-                # Convert other types to string
-                converted[key] = str(value)
+            # Exact-type lookup covers what the extractor produces; subclasses fall back to the isinstance chain
+            convert = _CHROMA_CONVERTERS.get(type(value))
+            converted[key] = convert(value) if convert is not None else _chroma_value_fallback(value)
         
         return converted
 
@@ -229,25 +354,46 @@ class DocumentProcessor:
         self.get_config = config_getter
         self.metadata_extractor = MetadataExtractor(config_getter)
     
-    def enhance_document_metadata(self, documents: List) -> List:
-        """Enhance documents with extracted metadata from content"""
+    def enhance_document_metadata(self, documents: List, n_jobs: int = 1) -> List:
+        """
+        Enhance documents with extracted metadata from content (metadata is updated in place)
+        
+        Extraction is CPU-bound regex work and documents are independent, so large batches
+        (at least _PARALLEL_METADATA_MIN_DOCS) can be spread over a process pool. The pool is
+        opt-in and uses the spawn start method, so the caller's process is never forked (unsafe
+        with torch/uvicorn threads). Spawned workers re-import the __main__ module, so only enable
+        it from a script whose entry point is guarded by `if __name__ == "__main__":` (e.g.
+        scripts/create_index.py) -- never from the API server, whose main.py builds models at import.
+        
+        Args:
+            documents: Documents to enhance
+            n_jobs: worker processes; 1 (default) runs serially in this process, -1 uses every core
+        """
         enhanced_documents = []
+        # Pick up any config changes once per batch rather than once per document
+        self.metadata_extractor.refresh_config()
+        # One processing timestamp for the whole batch
+        processed_at = datetime.now().isoformat()
         
-        for doc in documents:
-            # Extract metadata from document content
-            content_metadata = self.metadata_extractor.extract_content_metadata(doc.text)
-            
-            # Merge with existing metadata
-            enhanced_metadata = {**doc.metadata, **content_metadata}
-            
-            # Create enhanced document
-            from llama_index.core import Document
-            enhanced_doc = Document(
-                text=doc.text,
-                metadata=enhanced_metadata,
-                id_=doc.id_
-            )
-            enhanced_documents.append(enhanced_doc)
+        workers = (os.cpu_count() or 1) if n_jobs is None or n_jobs < 0 else n_jobs
+        workers = min(workers, len(documents))
+        if workers > 1 and len(documents) >= _PARALLEL_METADATA_MIN_DOCS:
+            rows = [(doc.text, processed_at) for doc in documents]
+            chunksize = max(1, len(rows) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_metadata_worker,
+                                     initargs=(self.metadata_extractor.config_snapshot(),)) as pool:
+                all_metadata = list(pool.map(_extract_metadata_row, rows, chunksize=chunksize))
+        else:
+            all_metadata = [
+                self.metadata_extractor.extract_content_metadata(doc.text, processed_at)
+                for doc in documents
+            ]
+        
+        for doc, content_metadata in zip(documents, all_metadata):
+            # Merge into the existing metadata; content metadata wins on key clashes
+            doc.metadata.update(content_metadata)
+            enhanced_documents.append(doc)
         
         return enhanced_documents
     
@@ -289,10 +435,18 @@ def validate_document_folder(folder_path: Path) -> None:
 
 def get_document_files(folder_path: Path, file_extensions: List[str]) -> List[Path]:
     """Get list of document files in the folder"""
-    files = []
-    for ext in file_extensions:
-        files.extend(folder_path.glob(f"**/*{ext}"))
-    return files
+    # One directory walk for all extensions (a glob per extension re-walks the whole tree);
+    # results stay grouped by extension in walk order, as the per-extension globs returned them
+    suffixes = [os.path.normcase(ext) for ext in file_extensions]
+    buckets: Dict[str, List[Path]] = {suffix: [] for suffix in suffixes}
+    for dirpath, dirnames, filenames in os.walk(folder_path):
+        base = Path(dirpath)
+        for name in filenames + dirnames:
+            norm = os.path.normcase(name)
+            for suffix, bucket in buckets.items():
+                if norm.endswith(suffix):
+                    bucket.append(base / name)
+    return [path for suffix in suffixes for path in buckets[suffix]]
 
 
 def format_context_with_metadata(nodes: List[Dict[str, Any]]) -> tuple:
@@ -309,54 +463,50 @@ def format_context_with_metadata(nodes: List[Dict[str, Any]]) -> tuple:
     debug_meta = []
     valid_ids = []
     
-    # Group chunks by source for better organization
-    source_groups = {}
+    # Single pass into parallel per-chunk arrays, plus the chunk indices of each source
+    # (sources keep first-seen order for better organization)
+    n = len(nodes)
+    ids = [f"C{i+1}" for i in range(n)]
+    texts = [""] * n
+    metas = [None] * n
+    scores = [0.0] * n
+    source_to_indices: Dict[str, List[int]] = {}
     for i, node in enumerate(nodes):
-        text = node.get("text", "")
         meta = node.get("metadata", {})
         source = meta.get("source") or meta.get("file_path") or meta.get("document_id") or "unknown"
-        
-        if source not in source_groups:
-            source_groups[source] = []
-        
-        cid = f"C{i+1}"
-        source_groups[source].append({
-            "id": cid,
-            "text": text,
-            "metadata": meta,
-            "score": node.get("score", 0.0)
-        })
+        texts[i] = node.get("text", "")
+        metas[i] = meta
+        scores[i] = node.get("score", 0.0)
+        source_to_indices.setdefault(source, []).append(i)
     
     # Format with source headers and metadata
-    for source, source_chunks in source_groups.items():
+    for source, indices in source_to_indices.items():
+        if chunks:
+            chunks.append("")  # Empty line between sources
+        
         # Add source header with metadata
         source_metadata = []
-        if source_chunks:
-            first_meta = source_chunks[0]["metadata"]
-            
-            # Extract relevant metadata for source header
-            if first_meta.get("category"):
-                source_metadata.append(f"Category: {first_meta['category']}")
-            if first_meta.get("sentiment"):
-                source_metadata.append(f"Sentiment: {first_meta['sentiment']}")
-            if first_meta.get("title"):
-                source_metadata.append(f"Title: {first_meta['title']}")
-            if first_meta.get("word_count"):
-                source_metadata.append(f"Words: {first_meta['word_count']}")
+        first_meta = metas[indices[0]]
         
-        # Create source header
-        source_header = f"📄 **Source: {source}**"
-        if source_metadata:
-            source_header += f" ({', '.join(source_metadata)})"
+        # Extract relevant metadata for source header
+        if first_meta.get("category"):
+            source_metadata.append(f"Category: {first_meta['category']}")
+        if first_meta.get("sentiment"):
+            source_metadata.append(f"Sentiment: {first_meta['sentiment']}")
+        if first_meta.get("title"):
+            source_metadata.append(f"Title: {first_meta['title']}")
+        if first_meta.get("word_count"):
+            source_metadata.append(f"Words: {first_meta['word_count']}")
         
-        chunks.append(source_header)
+        # Create source header (one string build, metadata suffix only when present)
+        chunks.append(f"📄 **Source: {source}** ({', '.join(source_metadata)})" if source_metadata
+                      else f"📄 **Source: {source}**")
         
         # Add chunks for this source
-        for chunk in source_chunks:
-            cid = chunk["id"]
-            text = chunk["text"]
-            meta = chunk["metadata"]
-            score = chunk["score"]
+        for i in indices:
+            cid = ids[i]
+            text = texts[i]
+            meta = metas[i]
             
             # Add chunk-level metadata context
             chunk_metadata = []
@@ -370,11 +520,8 @@ def format_context_with_metadata(nodes: List[Dict[str, Any]]) -> tuple:
                 chunk_metadata.append("Contains Email: Yes")
             
             # Format chunk with metadata
-            chunk_text = f"{cid}: {text}"
-            if chunk_metadata:
-                chunk_text += f" [{', '.join(chunk_metadata)}]"
-            
-            chunks.append(chunk_text)
+            chunks.append(f"{cid}: {text} [{', '.join(chunk_metadata)}]" if chunk_metadata
+                          else f"{cid}: {text}")
             valid_ids.append(cid)
             
             debug_meta.append({
@@ -382,15 +529,9 @@ def format_context_with_metadata(nodes: List[Dict[str, Any]]) -> tuple:
                 "source": source,
                 "chars": len(text),
                 "chunk_id": cid,
-                "score": score,
+                "score": scores[i],
                 "metadata": meta
             })
-        
-        chunks.append("")  # Empty line between sources
-    
-    # Remove trailing empty lines
-    while chunks and chunks[-1] == "":
-        chunks.pop()
     
     context_str = "\n".join(chunks)
     return context_str, debug_meta, valid_ids
@@ -407,13 +548,7 @@ def filter_chunks_by_similarity(chunks: List[Dict[str, Any]], threshold: float)
     Returns:
         List of chunks that meet the similarity threshold
     """
-    filtered_chunks = []
-    for chunk in chunks:
-        score = chunk.get("score", 0.0)
-        if score >= threshold:
-            filtered_chunks.append(chunk)
-    
-    return filtered_chunks
+    return [chunk for chunk in chunks if chunk.get("score", 0.0) >= threshold]
 
 
 def get_filtering_metrics(original_chunks: List[Dict[str, Any]], filtered_chunks: List[Dict[str, Any]], threshold: float) -> Dict[str, Any]:
@@ -441,5 +576,40 @@ def get_filtering_metrics(original_chunks: List[Dict[str, Any]], filtered_chunks
     }
 
 
-
-
+def filter_and_metrics(chunks: List[Dict[str, Any]], threshold: float) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Filter chunks by similarity threshold and compute the filtering metrics in the same pass.
+    
+    Equivalent to filter_chunks_by_similarity followed by get_filtering_metrics, without
+    reading every chunk's score twice or building an intermediate score list.
+    
+    Args:
+        chunks: List of chunks with 'score' field
+        threshold: Minimum similarity score to keep
+        
+    Returns:
+        Tuple of (filtered_chunks, filtering_metrics)
+    """
+    kept = []
+    score_sum = 0.0
+    score_min = score_max = None
+    for chunk in chunks:
+        score = chunk.get("score", 0.0)
+        if score >= threshold:
+            kept.append(chunk)
+            score_sum += score
+            if score_min is None or score < score_min:
+                score_min = score
+            if score_max is None or score > score_max:
+                score_max = score
+    
+    n_kept = len(kept)
+    return kept, {
+        "threshold": threshold,
+        "original_chunks": len(chunks),
+        "filtered_chunks": n_kept,
+        "filtered_out_count": len(chunks) - n_kept,
+        "avg_filtered_score": score_sum / n_kept if n_kept else 0.0,
+        "min_filtered_score": score_min if n_kept else 0.0,
+        "max_filtered_score": score_max if n_kept else 0.0
+    }
@@ -16,8 +16,26 @@
 import json, ast, re
 from typing import Any, Optional, Union
 
+try:
+    import orjson  # optional: C parser for the well-formed case; stdlib json remains the fallback
+except ImportError:
+    orjson = None
+
+# orjson turns integers outside [-2**63, 2**64 - 1] into floats. Any run of 19+ digits could be
+# one (e.g. -9223372036854775809), so such inputs go to the stdlib parser, which keeps exact ints
+_RE_LONG_INT = re.compile(r"\d{19}")
+
 # ---------- Internal helpers ----------
 
+def _json_loads(s: str) -> Any:
+    """json.loads with an orjson first attempt; anything orjson rejects is retried with json."""
+    if orjson is not None and not _RE_LONG_INT.search(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
 def _strip_code_fences(s: str) -> str:
     # Remove fenced code markers while preserving inner content
     s = re.sub(r"^\s*```(?:json)?\s*", "", s, flags=re.IGNORECASE | re.MULTILINE)
@@ -27,37 +45,64 @@ def _strip_code_fences(s: str) -> str:
     return s.strip()
 
 def _normalize_unicode_quotes(s: str) -> str:
+    # Smart quotes are non-ASCII; isascii() is O(1) on CPython strings. str.replace is kept over
+    # str.translate: for these four code points it is far faster than a per-character mapping.
+    if s.isascii():
+        return s
     return (
         s.replace("\u201c", '"').replace("\u201d", '"')  # " "
          .replace("\u2018", "'").replace("\u2019", "'")  # ' '
     )
 
+def _needs_cleanup(s: str) -> bool:
+    # Fences or smart quotes that _strip_code_fences / _normalize_unicode_quotes would rewrite
+    return "```" in s or "'''" in s or (not s.isascii() and any(q in s for q in "\u201c\u201d\u2018\u2019"))
+
+# Repair patterns, compiled once (coerce_json may run the repairs twice per response)
+_RE_LEADING_LABEL = re.compile(r"^\s*(json|output|result)\s*:\s*", re.IGNORECASE)
+_RE_CONFIDENCE_GLITCH = re.compile(r'("confidence")\s*"\s*("low"|"medium"|"high")', re.IGNORECASE)
+_RE_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_RE_BARE_KEY = re.compile(r'(?m)(?P<pre>[\{\s,])(?P<key>[A-Za-z_][A-Za-z0-9_\-]*)\s*:')
+_RE_PY_LITERAL = re.compile(r"\b(True|False|None)\b")
+_PY_TO_JSON_LITERAL = {"True": "true", "False": "false", "None": "null"}
+
 def _repair_common_glitches(s: str) -> str:
     t = s
+    # Each pass below is skipped when a literal every match must contain is absent;
+    # `in` on str is a C-level scan, far cheaper than running the regex engine
 
     # Remove leading labels like: "json:", "Here is the JSON:", "Output:"
-    t = re.sub(r"^\s*(json|output|result)\s*:\s*", "", t, flags=re.IGNORECASE)
+    if ":" in t:
+        t = _RE_LEADING_LABEL.sub("", t)
 
     # Fix: "confidence"" "low"  ->  "confidence": "low"
-    t = re.sub(r'("confidence")\s*"\s*("low"|"medium"|"high")', r'\1:\2', t, flags=re.IGNORECASE)
+    t = _RE_CONFIDENCE_GLITCH.sub(r'\1:\2', t)
 
     # Remove trailing commas before } or ]
-    t = re.sub(r',\s*([}\]])', r'\1', t)
+    if "," in t:
+        t = _RE_TRAILING_COMMA.sub(r'\1', t)
 
     # Ensure bareword keys are quoted: confidence: "Low" -> "confidence": "Low"
-    t = re.sub(r'(?m)(?P<pre>[\{\s,])(?P<key>[A-Za-z_][A-Za-z0-9_\-]*)\s*:', r'\g<pre>"\g<key>":', t)
+    if ":" in t:
+        t = _RE_BARE_KEY.sub(r'\g<pre>"\g<key>":', t)
 
     # Normalize Python literals to JSON
-    t = re.sub(r"\bTrue\b", "true", t)
-    t = re.sub(r"\bFalse\b", "false", t)
-    t = re.sub(r"\bNone\b", "null", t)
+    if "True" in t or "False" in t or "None" in t:
+        t = _RE_PY_LITERAL.sub(lambda m: _PY_TO_JSON_LITERAL[m.group(1)], t)
 
     return t.strip()
 
+# Bracket-only scanners: the regex engine skips every other character in C
+_RE_BRACKETS = {
+    ("{", "}"): re.compile(r"[{}]"),
+    ("[", "]"): re.compile(r"[\[\]]"),
+}
+
 def _balanced_substring(s: str, opener: str, closer: str) -> Optional[str]:
     depth = 0
     start = -1
-    for i, ch in enumerate(s):
+    for m in _RE_BRACKETS[(opener, closer)].finditer(s):
+        i, ch = m.start(), m.group()
         if ch == opener:
             if depth == 0:
                 start = i
@@ -108,17 +153,25 @@ def coerce_json(raw: Union[str, bytes, dict, list, Any]) -> Optional[dict]:
     if not s:
         return {"answer": ""}
 
+    # 0) fast path: already-clean JSON needs no fence stripping, quote normalization or repairs
+    if s[0] in "{[" and s[-1] in "}]" and not _needs_cleanup(s):
+        try:
+            obj = _json_loads(s)
+            return obj if isinstance(obj, dict) else {"answer": "", "items": obj}
+        except Exception:
+            pass
+
     # 1) strip code fences & normalize quotes
     s = _strip_code_fences(s)
     s = _normalize_unicode_quotes(s)
 
     # 2) try direct parse
     try:
-        obj = json.loads(s)
+        obj = _json_loads(s)
         if isinstance(obj, str):
             # handle double-encoded json
             try:
-                obj2 = json.loads(obj)
+                obj2 = _json_loads(obj)
                 return obj2 if isinstance(obj2, dict) else {"answer": obj}
             except Exception:
                 return {"answer": obj}
@@ -133,12 +186,12 @@ def coerce_json(raw: Union[str, bytes, dict, list, Any]) -> Optional[dict]:
     candidate = _extract_first_balanced_json(s)
     if candidate:
         try:
-            obj = json.loads(candidate)
+            obj = _json_loads(candidate)
             return obj if isinstance(obj, dict) else {"answer": "", "items": obj}
         except Exception:
             repaired = _repair_common_glitches(candidate)
             try:
-                obj = json.loads(repaired)
+                obj = _json_loads(repaired)
                 return obj if isinstance(obj, dict) else {"answer": "", "items": obj}
             except Exception:
                 try:
@@ -153,7 +206,7 @@ def coerce_json(raw: Union[str, bytes, dict, list, Any]) -> Optional[dict]:
     # 4) attempt repairs on full string
     s2 = _repair_common_glitches(s)
     try:
-        obj = json.loads(s2)
+        obj = _json_loads(s2)
         if isinstance(obj, dict):
             return obj
         if isinstance(obj, list):
@@ -173,7 +226,7 @@ def coerce_json(raw: Union[str, bytes, dict, list, Any]) -> Optional[dict]:
     if inner and inner != s:
         repaired = _repair_common_glitches(inner)
         try:
-            obj = json.loads(repaired)
+            obj = _json_loads(repaired)
             if isinstance(obj, dict):
                 return obj
             if isinstance(obj, list):